@@ -3,17 +3,281 @@ NovaOS V2 R&D Expert Council
 Token-efficient advisory board with 4 expert avatars
 """
 
-import anthropic
-from typing import Dict, List, Any
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+from functools import cached_property, wraps
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 from core.memory import get_memory
 from config.settings import (
     ANTHROPIC_API_KEY, MODELS, DEFAULT_MODELS,
-    COUNCIL_AVATAR_BUDGET, COUNCIL_AVATARS, MCP_CONFIG
+    COUNCIL_AVATAR_BUDGET, COUNCIL_AVATARS, MCP_CONFIG, CACHE_SETTINGS,
+    BATCH_API_COST_MULTIPLIER
 )
 
 
+# Static system prompts are module constants so every call sends a
+# byte-identical prefix, which is what Anthropic's prompt cache keys on.
+_AVATAR_SYSTEM_TEMPLATE = """You are the {name} avatar in the NovaOS R&D Expert Council.
+
+Your perspective: {perspective}
+Your key question: {key_question}
+Your focus: {focus}
+
+Analyze the question through YOUR unique lens. Be:
+- BRIEF: Maximum 3-4 sentences
+- SPECIFIC: Concrete insights, not generic advice
+- CONTRARIAN: Challenge assumptions if needed
+- ACTIONABLE: Focus on what to do
+
+Do not say "I think" or "In my opinion" - just provide your analysis directly."""
+
+_CONSENSUS_SYSTEM_PROMPT = """You are synthesizing expert opinions from 4 perspectives: Thiel (contrarian/monopoly), Musk (first principles/speed), Graham (fundamentals/PMF), and Taleb (risk/antifragility).
+
+Your task:
+1. Identify common themes and agreements
+2. Note key disagreements or tensions
+3. Provide a balanced recommendation
+4. List 2-3 specific action items
+
+Be BRIEF (4-5 sentences max) and ACTIONABLE.
+
+Submit your synthesis with the submit_synthesis tool. List up to 3 key dissents, each prefixed with the avatar's name (e.g. "Taleb: ...")."""
+
+# Forced tool call so the consensus comes back as structured data instead
+# of prose that has to be mined for action items and dissents
+_SYNTHESIS_TOOL = {
+    "name": "submit_synthesis",
+    "description": "Submit the council consensus, action items and dissents",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "consensus": {"type": "string"},
+            "action_items": {
+                "type": "array",
+                "items": {"type": "string"},
+                "maxItems": 5
+            },
+            "dissents": {
+                "type": "array",
+                "items": {"type": "string"},
+                "maxItems": 3
+            }
+        },
+        "required": ["consensus", "action_items"]
+    }
+}
+
+
+# Single-call council: one prompt plays all four avatars plus the
+# synthesizer, and a forced tool call returns the structured result.
+_FAST_COUNCIL_SYSTEM_PROMPT = """You are the NovaOS R&D Expert Council: four expert avatars and a synthesizer.
+
+""" + "\n".join(
+    f"{avatar['name']} - perspective: {avatar['perspective']}; "
+    f"key question: {avatar['key_question']}; focus: {avatar['focus']}"
+    for avatar in COUNCIL_AVATARS.values()
+) + """
+
+For each avatar, analyze the question through THAT avatar's unique lens. Each analysis must be:
+- BRIEF: Maximum 3-4 sentences
+- SPECIFIC: Concrete insights, not generic advice
+- CONTRARIAN: Challenge assumptions if needed
+- ACTIONABLE: Focus on what to do
+
+Then synthesize: identify agreements, note key tensions, give a balanced recommendation (4-5 sentences max) and 2-3 specific action items."""
+
+_FAST_COUNCIL_TOOL = {
+    "name": "submit_council_analysis",
+    "description": "Submit every avatar's analysis and the council consensus",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            **{name: {"type": "string"} for name in COUNCIL_AVATARS},
+            "consensus": {"type": "string"},
+            "action_items": {
+                "type": "array",
+                "items": {"type": "string"},
+                "maxItems": 5
+            }
+        },
+        "required": [*COUNCIL_AVATARS, "consensus", "action_items"]
+    }
+}
+
+
+def _cached_system(text: str) -> List[Dict[str, Any]]:
+    """Wrap a static system prompt so Anthropic serves it from prompt cache"""
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+_CONSENSUS_SYSTEM_BLOCKS = _cached_system(_CONSENSUS_SYSTEM_PROMPT)
+_FAST_COUNCIL_SYSTEM_BLOCKS = _cached_system(_FAST_COUNCIL_SYSTEM_PROMPT)
+
+
+def _token_rates(model: Dict[str, Any]) -> Tuple[float, float, float, float]:
+    """Per-token (input, output, cache read, cache write) prices for a MODELS entry"""
+    return (
+        model["input_cost"] / 1_000_000,
+        model["output_cost"] / 1_000_000,
+        model["cache_read_cost"] / 1_000_000,
+        model["cache_write_cost"] / 1_000_000
+    )
+
+
+def _usage_cost(rates: Tuple[float, float, float, float], usage,
+                cost_multiplier: float = 1.0) -> Dict[str, Any]:
+    """Token counts and cost for a response, pricing prompt-cache tokens"""
+    input_rate, output_rate, cache_read_rate, cache_write_rate = rates
+    input_tokens = usage.input_tokens
+    output_tokens = usage.output_tokens
+    cache_read_tokens = getattr(usage, "cache_read_input_tokens", 0) or 0
+    cache_creation_tokens = getattr(usage, "cache_creation_input_tokens", 0) or 0
+
+    cost = (
+        input_tokens * input_rate +
+        output_tokens * output_rate +
+        cache_read_tokens * cache_read_rate +
+        cache_creation_tokens * cache_write_rate
+    ) * cost_multiplier
+
+    return {
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "cache_read_tokens": cache_read_tokens,
+        "cache_creation_tokens": cache_creation_tokens,
+        "tokens_used": (input_tokens + output_tokens +
+                        cache_read_tokens + cache_creation_tokens),
+        "cost": cost
+    }
+
+
+# Words that mark a cautionary / dissenting sentence in an analysis.
+# Matched as word prefixes, so "risks" and "concerns" count but
+# "distribute" does not count as "but".
+_WARNING_KEYWORDS = [
+    'risk', 'danger', 'concern', 'problem', 'avoid', 'don\'t',
+    'warning', 'caution', 'however', 'but', 'unlikely'
+]
+_WARNING_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, _WARNING_KEYWORDS)) + ")",
+    re.IGNORECASE
+)
+
+# Sentence boundary: terminal punctuation followed by whitespace, so
+# decimals ("3.5%") and dotted tokens ("U.S.-based") stay in one sentence
+_SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Punctuation + whitespace pairs that end the previous sentence
+_SENTENCE_STARTS = ('. ', '! ', '? ', '.\n', '!\n', '?\n')
+
+
+def _sentence_around(text: str, start: int, end: int) -> str:
+    """The sentence of text containing the span text[start:end]"""
+    sentence_start = max(text.rfind(mark, 0, start) for mark in _SENTENCE_STARTS)
+    sentence_start = sentence_start + 2 if sentence_start >= 0 else 0
+
+    boundary = _SENTENCE_BOUNDARY_RE.search(text, end)
+    sentence_end = boundary.start() if boundary else len(text)
+
+    return text[sentence_start:sentence_end].strip()
+
+
+# A numbered ("1." / "2)") or bulleted ("-", "*", "•") line in the consensus
+_ACTION_ITEM_RE = re.compile(r"^[ \t]*(?:[-*•]|\d+[.)])[ \t]+(.+?)[ \t]*$", re.MULTILINE)
+
+# One client (and so one httpx connection pool) shared by every avatar
+# and the council, so keep-alive sockets are reused across calls.
+_HTTP_LIMITS = {"max_keepalive_connections": 8, "max_connections": 16}
+_shared_client = None
+_client_lock = threading.Lock()
+
+
+def _get_client():
+    """Get or create the shared Anthropic client"""
+    global _shared_client
+    if _shared_client is None:
+        with _client_lock:
+            if _shared_client is None:
+                # The SDK (httpx, pydantic) is imported on first use so importing
+                # this module stays cheap for callers that never convene the council
+                import anthropic
+                import httpx
+                _shared_client = anthropic.Anthropic(
+                    api_key=ANTHROPIC_API_KEY,
+                    http_client=anthropic.DefaultHttpxClient(
+                        limits=httpx.Limits(**_HTTP_LIMITS)
+                    )
+                )
+    return _shared_client
+
+
+def _async_client():
+    """Create an AsyncAnthropic client for one event loop's worth of calls"""
+    import anthropic
+    import httpx
+    return anthropic.AsyncAnthropic(
+        api_key=ANTHROPIC_API_KEY,
+        http_client=anthropic.DefaultAsyncHttpxClient(limits=httpx.Limits(**_HTTP_LIMITS))
+    )
+
+
+# In-process layer of the response cache: key -> (stored_at, text).
+# Backed by the response_cache table in NovaMemory so hits survive restarts.
+_response_cache: Dict[str, Tuple[float, str]] = {}
+
+
+def _response_cache_key(model_id: str, system_prompt: str, user_prompt: str) -> str:
+    """Content hash identifying an identical request"""
+    payload = f"{model_id}|{system_prompt}|{user_prompt}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _get_cached_response(memory, cache_key: str) -> Optional[str]:
+    """Look up a previous response for an identical request"""
+    if not CACHE_SETTINGS["enabled"]:
+        return None
+
+    ttl = CACHE_SETTINGS["ttl_seconds"]["council_responses"]
+    entry = _response_cache.get(cache_key)
+    if entry and time.time() - entry[0] < ttl:
+        return entry[1]
+
+    return memory.get_cached_response(cache_key, max_age_seconds=ttl)
+
+
+def _store_cached_response(memory, cache_key: str, text: str):
+    """Remember a successful response for later identical requests"""
+    if not CACHE_SETTINGS["enabled"]:
+        return
+
+    if len(_response_cache) >= CACHE_SETTINGS["max_entries"]:
+        # Evict the oldest entry (dicts keep insertion order)
+        _response_cache.pop(next(iter(_response_cache)))
+    _response_cache[cache_key] = (time.time(), text)
+    memory.cache_response(cache_key, text)
+
+
+def _cached_result(key: str, text: str) -> Dict[str, Any]:
+    """Result for a cache hit - no API call, so no tokens or cost"""
+    return {key: text, "tokens_used": 0, "cost": 0.0}
+
+
+def _echo_stream(text: str):
+    """Print a streamed text fragment under the current progress line"""
+    print(text.replace("\n", "\n      "), end="", flush=True)
+
+
+def _all_failed(analyses: Dict[str, str]) -> bool:
+    """True when every avatar analysis is an API error"""
+    return all(analysis.startswith("Error:") for analysis in analyses.values())
+
+
 class ExpertAvatar:
     """Base class for expert avatar"""
 
@@ -21,74 +285,161 @@ class ExpertAvatar:
         self.name = name
         self.config = config
         self.token_budget = COUNCIL_AVATAR_BUDGET
-        self.client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+        # The system prompt never changes after construction - format it
+        # (and its prompt-cache block) once instead of on every call
+        self._system_prompt = _AVATAR_SYSTEM_TEMPLATE.format_map({**config, "name": name})
+        self._system_blocks = _cached_system(self._system_prompt)
         self.model = DEFAULT_MODELS["council"]
+        self._model_id = MODELS[self.model]["id"]
+        self._token_rates = _token_rates(MODELS[self.model])
         self.memory = get_memory()
+        self._log_api_cost = self.memory.log_api_cost
+        # When set (by ExpertCouncil), cost rows are handed to this sink and
+        # written in one batch instead of one commit per call
+        self.cost_sink: Optional[Callable[..., None]] = None
+
+    @cached_property
+    def client(self):
+        """Shared Anthropic client, resolved on first API call"""
+        return _get_client()
+
+    def _log_cost(self, **entry):
+        """Log an API cost now, or buffer it for a batched write"""
+        if self.cost_sink is not None:
+            self.cost_sink(**entry)
+        else:
+            self._log_api_cost(**entry)
+
+    def _build_user_prompt(self, question: str, context: str = "") -> str:
+        """Build the user prompt for a question"""
+
+        user_prompt = f"""Question: {question}
+
+{context if context else ''}
+
+Provide your {self.name}-style analysis."""
+
+        return user_prompt
+
+    def _request_params(self, user_prompt: str) -> Dict[str, Any]:
+        """messages.create() parameters for a user prompt"""
+        return {
+            "model": self._model_id,
+            "max_tokens": self.token_budget,
+            "system": self._system_blocks,
+            "messages": [{"role": "user", "content": user_prompt}]
+        }
+
+    def _process_response(self, response, cache_key: str,
+                          cost_multiplier: float = 1.0) -> Dict[str, Any]:
+        """Log usage/cost for a completed response and build the result"""
+
+        usage = _usage_cost(self._token_rates, response.usage, cost_multiplier)
+
+        # Log cost
+        self._log_cost(
+            model=self._model_id,
+            operation=f"council_{self.name.lower()}_analysis",
+            input_tokens=usage["input_tokens"],
+            output_tokens=usage["output_tokens"],
+            cost=usage["cost"],
+            agent_id=f"council_{self.name.lower()}",
+            agent_name=f"{self.name} Avatar",
+            department="research",
+            cache_read_tokens=usage["cache_read_tokens"],
+            cache_creation_tokens=usage["cache_creation_tokens"]
+        )
+
+        analysis = response.content[0].text
+        _store_cached_response(self.memory, cache_key, analysis)
+
+        return {
+            "analysis": analysis,
+            "tokens_used": usage["tokens_used"],
+            "cost": usage["cost"]
+        }
+
+    def _error_result(self, error: Exception) -> Dict[str, Any]:
+        """Result returned when the API call fails"""
+        return {
+            "analysis": f"Error: {str(error)}",
+            "tokens_used": 0,
+            "cost": 0.0
+        }
 
     def analyze(self, question: str, context: str = "") -> Dict[str, Any]:
         """Analyze a question from this avatar's perspective"""
 
-        system_prompt = f"""You are the {self.name} avatar in the NovaOS R&D Expert Council.
+        user_prompt = self._build_user_prompt(question, context)
+        cache_key = _response_cache_key(self._model_id, self._system_prompt, user_prompt)
 
-Your perspective: {self.config['perspective']}
-Your key question: {self.config['key_question']}
-Your focus: {self.config['focus']}
+        cached = _get_cached_response(self.memory, cache_key)
+        if cached is not None:
+            return _cached_result("analysis", cached)
 
-Analyze the question through YOUR unique lens. Be:
-- BRIEF: Maximum 3-4 sentences
-- SPECIFIC: Concrete insights, not generic advice
-- CONTRARIAN: Challenge assumptions if needed
-- ACTIONABLE: Focus on what to do
+        try:
+            response = self.client.messages.create(**self._request_params(user_prompt))
+            return self._process_response(response, cache_key)
 
-Do not say "I think" or "In my opinion" - just provide your analysis directly."""
+        except Exception as e:
+            return self._error_result(e)
 
-        user_prompt = f"""Question: {question}
+    def analyze_stream(self, question: str, context: str = "",
+                       on_text: Callable[[str], None] = None) -> Dict[str, Any]:
+        """
+        Streaming variant of analyze()
 
-{context if context else ''}
+        Args:
+            question: The question to analyze
+            context: Optional extra context for the prompt
+            on_text: Called with each text fragment as it is generated
+        """
 
-Provide your {self.name}-style analysis."""
+        user_prompt = self._build_user_prompt(question, context)
+        cache_key = _response_cache_key(self._model_id, self._system_prompt, user_prompt)
+
+        cached = _get_cached_response(self.memory, cache_key)
+        if cached is not None:
+            if on_text:
+                on_text(cached)
+            return _cached_result("analysis", cached)
 
         try:
-            response = self.client.messages.create(
-                model=MODELS[self.model]["id"],
-                max_tokens=self.token_budget,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}]
-            )
+            with self.client.messages.stream(**self._request_params(user_prompt)) as stream:
+                if on_text:
+                    for text in stream.text_stream:
+                        on_text(text)
+                response = stream.get_final_message()
 
-            # Extract usage
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
-
-            # Calculate cost
-            input_cost = (input_tokens / 1_000_000) * MODELS[self.model]["input_cost"]
-            output_cost = (output_tokens / 1_000_000) * MODELS[self.model]["output_cost"]
-            total_cost = input_cost + output_cost
-
-            # Log cost
-            self.memory.log_api_cost(
-                model=MODELS[self.model]["id"],
-                operation=f"council_{self.name.lower()}_analysis",
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                cost=total_cost,
-                agent_id=f"council_{self.name.lower()}",
-                agent_name=f"{self.name} Avatar",
-                department="research"
-            )
+            return self._process_response(response, cache_key)
 
-            return {
-                "analysis": response.content[0].text,
-                "tokens_used": input_tokens + output_tokens,
-                "cost": total_cost
-            }
+        except Exception as e:
+            return self._error_result(e)
+
+    async def analyze_async(self, client, question: str,
+                            context: str = "") -> Dict[str, Any]:
+        """
+        Async variant of analyze() for concurrent council rounds
+
+        Args:
+            client: anthropic.AsyncAnthropic client shared by the round
+            question: The question to analyze
+            context: Optional extra context for the prompt
+        """
+
+        user_prompt = self._build_user_prompt(question, context)
+        cache_key = _response_cache_key(self._model_id, self._system_prompt, user_prompt)
+
+        cached = _get_cached_response(self.memory, cache_key)
+        if cached is not None:
+            return _cached_result("analysis", cached)
+
+        try:
+            response = await client.messages.create(**self._request_params(user_prompt))
+            return self._process_response(response, cache_key)
 
         except Exception as e:
-            return {
-                "analysis": f"Error: {str(e)}",
-                "tokens_used": 0,
-                "cost": 0.0
-            }
+            return self._error_result(e)
 
 
 class ThielAvatar(ExpertAvatar):
@@ -119,6 +470,17 @@ class TalebAvatar(ExpertAvatar):
         super().__init__("Taleb", COUNCIL_AVATARS["taleb"])
 
 
+def _flushes_costs(method):
+    """Flush the council's buffered cost rows however the session ends"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._flush_costs()
+    return wrapper
+
+
 class ExpertCouncil:
     """R&D Expert Council - All 4 avatars"""
 
@@ -130,8 +492,45 @@ class ExpertCouncil:
             "taleb": TalebAvatar()
         }
         self.memory = get_memory()
-        self.client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+        self._log_council_session = self.memory.log_council_session
+        self._log_api_costs_batch = self.memory.log_api_costs_batch
+        self._model_id = MODELS[DEFAULT_MODELS["council"]]["id"]
+        self._token_rates = _token_rates(MODELS[DEFAULT_MODELS["council"]])
+
+        # Cost rows from all calls in a session, flushed in one transaction.
+        # The council is shared across threads, so the list is only touched
+        # under _costs_lock and swapped out whole when flushed.
+        self._pending_costs: List[Dict[str, Any]] = []
+        self._costs_lock = threading.Lock()
+        for avatar in self.avatars.values():
+            avatar.cost_sink = self._log_cost
+
+    @cached_property
+    def client(self):
+        """Shared Anthropic client, resolved on first API call"""
+        return _get_client()
+
+    def _log_cost(self, **entry):
+        """Buffer an API cost row until the session is finalized"""
+        with self._costs_lock:
+            self._pending_costs.append(entry)
+
+    def _flush_costs(self):
+        """Write all buffered cost rows in a single transaction"""
+        with self._costs_lock:
+            rows, self._pending_costs = self._pending_costs, []
+        if not rows:
+            return
 
+        try:
+            self._log_api_costs_batch(rows)
+        except Exception:
+            # Put them back for the next flush rather than dropping them
+            with self._costs_lock:
+                self._pending_costs[:0] = rows
+            raise
+
+    @_flushes_costs
     def analyze(self, question: str, sequential: bool = True) -> Dict[str, Any]:
         """
         Run full council analysis
@@ -151,44 +550,327 @@ class ExpertCouncil:
 
         if sequential:
             # Sequential debate - each avatar sees previous analyses
-            context = ""
+            context_parts: List[str] = []
 
             for avatar_name, avatar in self.avatars.items():
                 print(f"   Consulting {avatar.name} avatar...")
 
-                result = avatar.analyze(question, context)
+                # Stream so the analysis shows up while it is generated
+                print("      ", end="", flush=True)
+                result = avatar.analyze_stream(
+                    question, "\n\n".join(context_parts), on_text=_echo_stream
+                )
+                print()
                 analyses[avatar_name] = result['analysis']
                 total_tokens += result['tokens_used']
                 total_cost += result['cost']
 
                 # Add to context for next avatar
-                context += f"\n{avatar.name}'s view: {result['analysis']}\n"
+                context_parts.append(f"{avatar.name}'s view: {result['analysis']}")
 
         else:
-            # Parallel analysis - all avatars analyze independently
-            for avatar_name, avatar in self.avatars.items():
+            # Parallel analysis - all avatars analyze independently and
+            # concurrently, so wall time tracks the slowest avatar
+            for avatar in self.avatars.values():
                 print(f"   Consulting {avatar.name} avatar...")
 
-                result = avatar.analyze(question)
+            results = asyncio.run(self._analyze_parallel(question))
+
+            for avatar_name, result in zip(self.avatars, results):
                 analyses[avatar_name] = result['analysis']
                 total_tokens += result['tokens_used']
                 total_cost += result['cost']
 
+        # Nothing to synthesize if every avatar failed (missing key, API down)
+        if _all_failed(analyses):
+            return self._unavailable_result(question, analyses, total_tokens, total_cost)
+
         # Synthesize consensus
         print("   Synthesizing consensus...")
         consensus_result = self._synthesize_consensus(question, analyses)
         total_tokens += consensus_result['tokens_used']
         total_cost += consensus_result['cost']
 
-        # Extract action items and dissents
-        action_items = self._extract_action_items(consensus_result['consensus'])
+        # Structured output carries action items and dissents; fall back to
+        # the text heuristics only when it has none (e.g. a failed call)
+        action_items = (
+            consensus_result['action_items'] or
+            self._extract_action_items(consensus_result['consensus'])
+        )
+        dissents = consensus_result['dissents'] or self._identify_dissents(analyses)
+
+        return self._finalize_session(
+            question, analyses, consensus_result['consensus'],
+            action_items, dissents, total_tokens, total_cost
+        )
+
+    @_flushes_costs
+    def analyze_fast(self, question: str) -> Dict[str, Any]:
+        """
+        Run the whole council in a single API call
+
+        One request plays all four avatars and the synthesizer, returning
+        structured output via tool use. Much cheaper than analyze() (one
+        round-trip, one shared prompt), but the avatars do not reason
+        independently - use analyze() when that matters.
+        """
+
+        print(f"🔮 Convening R&D Expert Council (single call)...")
+        print(f"   Question: {question}\n")
+
+        user_prompt = f"""Question: {question}
+
+Give each expert's analysis, then synthesize the consensus and action items."""
+
+        cache_key = _response_cache_key(self._model_id, _FAST_COUNCIL_SYSTEM_PROMPT, user_prompt)
+        cached = _get_cached_response(self.memory, cache_key)
+
+        if cached is not None:
+            result = json.loads(cached)
+            total_tokens = 0
+            total_cost = 0.0
+        else:
+            try:
+                response = self.client.messages.create(
+                    model=self._model_id,
+                    max_tokens=len(self.avatars) * COUNCIL_AVATAR_BUDGET + 500,
+                    system=_FAST_COUNCIL_SYSTEM_BLOCKS,
+                    tools=[_FAST_COUNCIL_TOOL],
+                    tool_choice={"type": "tool", "name": _FAST_COUNCIL_TOOL["name"]},
+                    messages=[{"role": "user", "content": user_prompt}]
+                )
+
+                result = next(
+                    block.input for block in response.content
+                    if block.type == "tool_use"
+                )
+                usage = _usage_cost(self._token_rates, response.usage)
+
+                self._log_cost(
+                    model=self._model_id,
+                    operation="council_fast_analysis",
+                    input_tokens=usage["input_tokens"],
+                    output_tokens=usage["output_tokens"],
+                    cost=usage["cost"],
+                    agent_id="council_synthesis",
+                    agent_name="Council Synthesis",
+                    department="research",
+                    cache_read_tokens=usage["cache_read_tokens"],
+                    cache_creation_tokens=usage["cache_creation_tokens"]
+                )
+                _store_cached_response(self.memory, cache_key, json.dumps(result))
+                total_tokens = usage["tokens_used"]
+                total_cost = usage["cost"]
+
+            except Exception as e:
+                result = {name: f"Error: {str(e)}" for name in self.avatars}
+                total_tokens = 0
+                total_cost = 0.0
+
+        analyses = {name: result.get(name, "") for name in self.avatars}
+
+        # The single call failed: same short-circuit as analyze(), so no
+        # session of error strings is logged or saved to MCP
+        if _all_failed(analyses):
+            return self._unavailable_result(question, analyses, total_tokens, total_cost)
+
+        consensus = result.get("consensus", "")
+        action_items = (
+            result.get("action_items") or self._extract_action_items(consensus)
+        )[:5]
         dissents = self._identify_dissents(analyses)
 
+        return self._finalize_session(
+            question, analyses, consensus, action_items, dissents,
+            total_tokens, total_cost
+        )
+
+    @_flushes_costs
+    def analyze_many(self, questions: List[str],
+                     poll_interval: float = 10.0) -> List[Dict[str, Any]]:
+        """
+        Run independent council analyses for many questions in bulk
+
+        Uses the Message Batches API: every avatar call for every question
+        goes out as one batch, then every consensus as a second batch.
+        Batches are billed at a discount but complete asynchronously
+        (minutes, up to 24h), so this suits offline/bulk evaluation, not
+        interactive use - analyze() stays on the direct path.
+
+        Args:
+            questions: Questions to analyze (avatars analyze independently,
+                       as in analyze(sequential=False))
+            poll_interval: Seconds between batch status checks
+        """
+
+        print(f"🔮 Convening R&D Expert Council for {len(questions)} questions (batch)...")
+
+        # Round 1 - every avatar for every question
+        avatar_results: Dict[str, Dict[str, Any]] = {}
+        pending: Dict[str, Tuple[ExpertAvatar, str]] = {}
+        requests = []
+
+        for q_idx, question in enumerate(questions):
+            for avatar_name, avatar in self.avatars.items():
+                custom_id = f"q{q_idx}-{avatar_name}"
+                user_prompt = avatar._build_user_prompt(question)
+                cache_key = _response_cache_key(
+                    avatar._model_id, avatar._system_prompt, user_prompt
+                )
+                cached = _get_cached_response(self.memory, cache_key)
+                if cached is not None:
+                    avatar_results[custom_id] = _cached_result("analysis", cached)
+                else:
+                    pending[custom_id] = (avatar, cache_key)
+                    requests.append({
+                        "custom_id": custom_id,
+                        "params": avatar._request_params(user_prompt)
+                    })
+
+        try:
+            messages = self._run_batch(requests, poll_interval)
+        except Exception as e:
+            messages = {custom_id: e for custom_id in pending}
+
+        for custom_id, (avatar, cache_key) in pending.items():
+            message = messages.get(custom_id, "missing from batch results")
+            if isinstance(message, (str, Exception)):
+                avatar_results[custom_id] = avatar._error_result(message)
+            else:
+                avatar_results[custom_id] = avatar._process_response(
+                    message, cache_key, BATCH_API_COST_MULTIPLIER
+                )
+
+        # Round 2 - consensus for every question
+        all_analyses = []
+        consensus_results: Dict[str, Dict[str, Any]] = {}
+        pending_consensus: Dict[str, str] = {}
+        requests = []
+
+        for q_idx, question in enumerate(questions):
+            analyses = {
+                avatar_name: avatar_results[f"q{q_idx}-{avatar_name}"]['analysis']
+                for avatar_name in self.avatars
+            }
+            all_analyses.append(analyses)
+            if _all_failed(analyses):
+                continue
+
+            custom_id = f"q{q_idx}-consensus"
+            user_prompt = self._consensus_user_prompt(question, analyses)
+            cache_key = _response_cache_key(
+                self._model_id, _CONSENSUS_SYSTEM_PROMPT, user_prompt
+            )
+            cached = _get_cached_response(self.memory, cache_key)
+            if cached is not None:
+                consensus_results[custom_id] = self._synthesis_result(json.loads(cached))
+            else:
+                pending_consensus[custom_id] = cache_key
+                requests.append({
+                    "custom_id": custom_id,
+                    "params": self._consensus_params(user_prompt)
+                })
+
+        try:
+            messages = self._run_batch(requests, poll_interval)
+        except Exception as e:
+            messages = {custom_id: e for custom_id in pending_consensus}
+
+        for custom_id, cache_key in pending_consensus.items():
+            message = messages.get(custom_id, "missing from batch results")
+            if isinstance(message, (str, Exception)):
+                consensus_results[custom_id] = self._consensus_error(message)
+            else:
+                consensus_results[custom_id] = self._process_consensus(
+                    message, cache_key, BATCH_API_COST_MULTIPLIER
+                )
+
+        # Finalize one session per question
+        sessions = []
+        for q_idx, question in enumerate(questions):
+            analyses = all_analyses[q_idx]
+            results = [avatar_results[f"q{q_idx}-{name}"] for name in self.avatars]
+
+            if _all_failed(analyses):
+                sessions.append(self._unavailable_result(
+                    question, analyses,
+                    sum(result['tokens_used'] for result in results),
+                    sum(result['cost'] for result in results)
+                ))
+                continue
+
+            consensus_result = consensus_results[f"q{q_idx}-consensus"]
+            results.append(consensus_result)
+
+            sessions.append(self._finalize_session(
+                question, analyses, consensus_result['consensus'],
+                consensus_result['action_items'] or
+                self._extract_action_items(consensus_result['consensus']),
+                consensus_result['dissents'] or self._identify_dissents(analyses),
+                sum(result['tokens_used'] for result in results),
+                sum(result['cost'] for result in results)
+            ))
+
+        return sessions
+
+    def _run_batch(self, requests: List[Dict[str, Any]],
+                   poll_interval: float) -> Dict[str, Any]:
+        """
+        Submit a Message Batch and wait for it to finish
+
+        Returns a mapping of custom_id to the response message, or to the
+        result type ("errored", "canceled", "expired") for failed requests.
+        """
+        if not requests:
+            return {}
+
+        batch = self.client.messages.batches.create(requests=requests)
+        print(f"   Submitted batch {batch.id} ({len(requests)} requests)...")
+
+        while batch.processing_status != "ended":
+            time.sleep(poll_interval)
+            batch = self.client.messages.batches.retrieve(batch.id)
+
+        messages = {}
+        for entry in self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                messages[entry.custom_id] = entry.result.message
+            else:
+                messages[entry.custom_id] = f"batch request {entry.result.type}"
+        return messages
+
+    def _unavailable_result(self, question: str, analyses: Dict[str, str],
+                            total_tokens: int, total_cost: float) -> Dict[str, Any]:
+        """Result for a session where every avatar call failed
+
+        Skips the consensus call, action items, session log and MCP save.
+        """
+        self._flush_costs()
+        print("✗ Council unavailable - every avatar call failed\n")
+
+        return {
+            "question": question,
+            "analyses": analyses,
+            "consensus": "Council unavailable",
+            "action_items": [],
+            "dissents": [],
+            "tokens_used": total_tokens,
+            "cost": total_cost,
+            "session_id": None
+        }
+
+    def _finalize_session(self, question: str, analyses: Dict[str, str],
+                          consensus: str, action_items: List[str],
+                          dissents: List[str], total_tokens: int,
+                          total_cost: float) -> Dict[str, Any]:
+        """Log a finished session (SQLite + MCP) and build the result"""
+
         # Log to memory
-        session_id = self.memory.log_council_session(
+        self._flush_costs()
+        session_id = self._log_council_session(
             question=question,
             analyses=analyses,
-            consensus=consensus_result['consensus'],
+            consensus=consensus,
             action_items=action_items,
             dissents=dissents,
             tokens_used=total_tokens,
@@ -200,31 +882,18 @@ class ExpertCouncil:
             try:
                 from mcp__novaos_memory__save_memory import save_memory
 
-                content = f"""# R&D Expert Council Session
-
-**Question:** {question}
-
-## Thiel (Contrarian/Monopoly)
-{analyses['thiel']}
-
-## Musk (First Principles/Speed)
-{analyses['musk']}
-
-## Graham (Fundamentals/PMF)
-{analyses['graham']}
-
-## Taleb (Risk/Antifragility)
-{analyses['taleb']}
-
-## Consensus
-{consensus_result['consensus']}
-
-## Action Items
-{chr(10).join(f"- {item}" for item in action_items)}
-
----
-*Tokens: {total_tokens} | Cost: ${total_cost:.4f}*
-"""
+                content = "".join([
+                    "# R&D Expert Council Session\n\n",
+                    "**Question:** ", question, "\n\n",
+                    "## Thiel (Contrarian/Monopoly)\n", analyses['thiel'], "\n\n",
+                    "## Musk (First Principles/Speed)\n", analyses['musk'], "\n\n",
+                    "## Graham (Fundamentals/PMF)\n", analyses['graham'], "\n\n",
+                    "## Taleb (Risk/Antifragility)\n", analyses['taleb'], "\n\n",
+                    "## Consensus\n", consensus, "\n\n",
+                    "## Action Items\n", "\n".join(["- " + item for item in action_items]),
+                    "\n\n---\n",
+                    f"*Tokens: {total_tokens} | Cost: ${total_cost:.4f}*\n"
+                ])
 
                 save_memory(
                     doc_id=f"council-session-{session_id}",
@@ -239,7 +908,7 @@ class ExpertCouncil:
         return {
             "question": question,
             "analyses": analyses,
-            "consensus": consensus_result['consensus'],
+            "consensus": consensus,
             "action_items": action_items,
             "dissents": dissents,
             "tokens_used": total_tokens,
@@ -247,20 +916,38 @@ class ExpertCouncil:
             "session_id": session_id
         }
 
+    async def _analyze_parallel(self, question: str) -> List[Dict[str, Any]]:
+        """Fire all avatar calls at once and wait for every result"""
+        # The async client's connection pool is bound to the running event
+        # loop, so one client is shared by the whole round rather than kept
+        # across asyncio.run() calls.
+        async with _async_client() as client:
+            return await asyncio.gather(*[
+                avatar.analyze_async(client, question)
+                for avatar in self.avatars.values()
+            ])
+
     def _synthesize_consensus(self, question: str, analyses: Dict[str, str]) -> Dict[str, Any]:
         """Synthesize consensus from all avatar analyses"""
 
-        system_prompt = """You are synthesizing expert opinions from 4 perspectives: Thiel (contrarian/monopoly), Musk (first principles/speed), Graham (fundamentals/PMF), and Taleb (risk/antifragility).
+        user_prompt = self._consensus_user_prompt(question, analyses)
+        cache_key = _response_cache_key(
+            self._model_id, _CONSENSUS_SYSTEM_PROMPT, user_prompt
+        )
+        cached = _get_cached_response(self.memory, cache_key)
+        if cached is not None:
+            return self._synthesis_result(json.loads(cached))
 
-Your task:
-1. Identify common themes and agreements
-2. Note key disagreements or tensions
-3. Provide a balanced recommendation
-4. List 2-3 specific action items
+        try:
+            response = self.client.messages.create(**self._consensus_params(user_prompt))
+            return self._process_consensus(response, cache_key)
 
-Be BRIEF (4-5 sentences max) and ACTIONABLE."""
+        except Exception as e:
+            return self._consensus_error(e)
 
-        user_prompt = f"""Question: {question}
+    def _consensus_user_prompt(self, question: str, analyses: Dict[str, str]) -> str:
+        """Build the synthesizer's user prompt"""
+        return f"""Question: {question}
 
 EXPERT ANALYSES:
 
@@ -274,97 +961,105 @@ Taleb: {analyses['taleb']}
 
 Synthesize the consensus and provide action items."""
 
-        try:
-            response = self.client.messages.create(
-                model=MODELS[DEFAULT_MODELS["council"]]["id"],
-                max_tokens=500,  # Short consensus
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}]
-            )
+    def _consensus_params(self, user_prompt: str) -> Dict[str, Any]:
+        """messages.create() parameters for the consensus call"""
+        return {
+            "model": self._model_id,
+            "max_tokens": 500,  # Short consensus
+            "system": _CONSENSUS_SYSTEM_BLOCKS,
+            "tools": [_SYNTHESIS_TOOL],
+            "tool_choice": {"type": "tool", "name": _SYNTHESIS_TOOL["name"]},
+            "messages": [{"role": "user", "content": user_prompt}]
+        }
 
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
-
-            input_cost = (input_tokens / 1_000_000) * MODELS[DEFAULT_MODELS["council"]]["input_cost"]
-            output_cost = (output_tokens / 1_000_000) * MODELS[DEFAULT_MODELS["council"]]["output_cost"]
-            total_cost = input_cost + output_cost
-
-            self.memory.log_api_cost(
-                model=MODELS[DEFAULT_MODELS["council"]]["id"],
-                operation="council_consensus",
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                cost=total_cost,
-                agent_id="council_synthesis",
-                agent_name="Council Synthesis",
-                department="research"
-            )
+    def _process_consensus(self, response, cache_key: str,
+                           cost_multiplier: float = 1.0) -> Dict[str, Any]:
+        """Log usage/cost for a consensus response and build the result"""
+
+        usage = _usage_cost(self._token_rates, response.usage, cost_multiplier)
+
+        self._log_cost(
+            model=self._model_id,
+            operation="council_consensus",
+            input_tokens=usage["input_tokens"],
+            output_tokens=usage["output_tokens"],
+            cost=usage["cost"],
+            agent_id="council_synthesis",
+            agent_name="Council Synthesis",
+            department="research",
+            cache_read_tokens=usage["cache_read_tokens"],
+            cache_creation_tokens=usage["cache_creation_tokens"]
+        )
 
-            return {
-                "consensus": response.content[0].text,
-                "tokens_used": input_tokens + output_tokens,
-                "cost": total_cost
-            }
+        # The SDK has already parsed the tool input into a dict
+        synthesis = next(
+            block.input for block in response.content if block.type == "tool_use"
+        )
+        _store_cached_response(self.memory, cache_key, json.dumps(synthesis))
 
-        except Exception as e:
-            return {
-                "consensus": f"Error synthesizing: {str(e)}",
-                "tokens_used": 0,
-                "cost": 0.0
-            }
+        return self._synthesis_result(synthesis, usage["tokens_used"], usage["cost"])
+
+    def _synthesis_result(self, synthesis: Dict[str, Any], tokens_used: int = 0,
+                          cost: float = 0.0) -> Dict[str, Any]:
+        """Consensus result from submit_synthesis tool input"""
+        return {
+            "consensus": synthesis.get("consensus", ""),
+            "action_items": synthesis.get("action_items", [])[:5],
+            "dissents": synthesis.get("dissents", [])[:3],
+            "tokens_used": tokens_used,
+            "cost": cost
+        }
+
+    def _consensus_error(self, error: Exception) -> Dict[str, Any]:
+        """Result returned when the consensus call fails"""
+        return {
+            "consensus": f"Error synthesizing: {str(error)}",
+            "action_items": [],
+            "dissents": [],
+            "tokens_used": 0,
+            "cost": 0.0
+        }
 
     def _extract_action_items(self, consensus: str) -> List[str]:
         """Extract action items from consensus"""
-        # Simple extraction - look for numbered items or bullet points
+        # Simple extraction - numbered items (1., 2) etc.) or bullet points
         items = []
-        lines = consensus.split('\n')
 
-        for line in lines:
-            line = line.strip()
-            # Look for numbered items (1., 2., etc.) or bullet points (-, *, •)
-            if line and (line[0].isdigit() or line[0] in ['-', '*', '•']):
-                # Clean up
-                item = line.lstrip('0123456789.-*• ').strip()
-                if item:
-                    items.append(item)
+        for match in _ACTION_ITEM_RE.finditer(consensus):
+            items.append(match.group(1))
+            if len(items) >= 5:  # Max 5 action items
+                break
 
         # If no clear action items found, return generic
         if not items:
             items = ["Review full analysis and decide on implementation approach"]
 
-        return items[:5]  # Max 5 action items
+        return items
 
     def _identify_dissents(self, analyses: Dict[str, str]) -> List[str]:
         """Identify key disagreements or concerns"""
         # Look for negative keywords or warnings
-        warning_keywords = [
-            'risk', 'danger', 'concern', 'problem', 'avoid', 'don\'t',
-            'warning', 'caution', 'however', 'but', 'unlikely'
-        ]
-
         dissents = []
 
         for avatar_name, analysis in analyses.items():
-            analysis_lower = analysis.lower()
-
-            # Check if this analysis contains warnings
-            if any(keyword in analysis_lower for keyword in warning_keywords):
-                # Extract the cautionary part (simplified)
-                sentences = analysis.split('.')
-                for sentence in sentences:
-                    if any(keyword in sentence.lower() for keyword in warning_keywords):
-                        dissents.append(f"{avatar_name.title()}: {sentence.strip()}")
-                        break
+            # Extract the first cautionary sentence (simplified)
+            match = _WARNING_RE.search(analysis)
+            if match:
+                sentence = _sentence_around(analysis, match.start(), match.end())
+                dissents.append(f"{avatar_name.title()}: {sentence}")
 
         return dissents[:3]  # Max 3 dissents
 
 
 # Singleton instance
 _council_instance = None
+_council_lock = threading.Lock()
 
 def get_council() -> ExpertCouncil:
-    """Get or create council instance"""
+    """Get or create council instance (thread-safe)"""
     global _council_instance
     if _council_instance is None:
-        _council_instance = ExpertCouncil()
+        with _council_lock:
+            if _council_instance is None:
+                _council_instance = ExpertCouncil()
     return _council_instance
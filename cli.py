@@ -4,35 +4,74 @@ NovaOS V2 CLI - AI Business Orchestration Platform
 Command-line interface for managing NovaOS
 """
 
+import os
 import sys
+import re
+import contextlib
 import argparse
 import json
+import traceback
 from typing import Dict, Any
 from datetime import datetime
-
-# Import core modules
-from core.board import get_board
-from core.departments import get_departments
-from core.agent_factory import get_factory, AgentTemplates
-from core.memory import get_memory
-from integrations.monitoring import get_monitor
-from config.financial_targets import get_current_target
-from sandbox.manager import get_sandbox
-from workers.manager import get_worker_manager
-from workers.worker_monitor import get_worker_monitor
-from core.autonomous import get_autonomous_engine
-
-
-def print_header(title: str):
+from operator import itemgetter
+
+# Status icons for agent and sandbox project listings
+_AGENT_ICON = {'active': '▶', 'paused': '⏸', 'killed': '⨯'}
+_PROJECT_ICON = {'active': '▶', 'promoted': '✓', 'deleted': '⨯'}
+
+# One agent entry in `nova agents`, filled with str.format_map
+_AGENT_ROW = (
+    "{icon} {name} ({agent_id})\n"
+    "   Type: {type} | Dept: {department} | Status: {status}\n"
+    "   Cost: ${cost:,.2f} | Revenue: ${revenue:,.2f} | ROI: {roi:.1f}%\n"
+)
+
+# One worker entry in `nova workers status`
+_WORKER_ROW = (
+    "\n[{worker_id}] {name}\n"
+    "  Status: {status}\n"
+    "  Uptime: {uptime}\n"
+    "  ROI: {roi:.1f}%\n"
+    "  Profit: ${profit:,.2f}"
+)
+
+# R&D Council avatars in display order
+_AVATARS = (
+    ('thiel', 'Thiel (Contrarian/Monopoly)'),
+    ('musk', 'Musk (First Principles/Speed)'),
+    ('graham', 'Graham (Fundamentals/PMF)'),
+    ('taleb', 'Taleb (Risk/Antifragility)'),
+)
+
+
+class Out:
+    """Collects report lines and writes them to stdout in a single call"""
+    __slots__ = ("buf",)
+
+    def __init__(self):
+        self.buf = []
+
+    def p(self, s: str = ""):
+        self.buf.append(s)
+
+    def flush(self):
+        if self.buf:
+            sys.stdout.write("\n".join(self.buf) + "\n")
+            self.buf = []
+
+
+def print_header(title: str, out: Out = None):
     """Print formatted header"""
-    print("\n" + "=" * 60)
-    print(f"  {title}")
-    print("=" * 60 + "\n")
+    write = out.p if out else print
+    write("\n" + "=" * 60)
+    write(f"  {title}")
+    write("=" * 60 + "\n")
 
 
-def print_section(title: str):
+def print_section(title: str, out: Out = None):
     """Print section header"""
-    print(f"\n--- {title} ---")
+    write = out.p if out else print
+    write(f"\n--- {title} ---")
 
 
 def format_currency(amount: float) -> str:
@@ -45,157 +84,239 @@ def format_percent(value: float) -> str:
     return f"{value:.1f}%"
 
 
+# Departments registered by core.departments.DepartmentRegistry
+KNOWN_DEPARTMENTS = ('sales', 'marketing', 'product', 'operations', 'research')
+
+# Department names are single words: sales, marketing, product, ...
+_DEPARTMENT_NAME_RE = re.compile(r'[A-Za-z]+')
+
+# key=value pairs separated by commas, e.g. "budget=100, model=haiku"
+_KV_RE = re.compile(r'([^=,]+)=([^,]*)')
+
+
+def _parse_config(raw: str) -> Dict[str, Any]:
+    """Parse --config as JSON, falling back to comma-separated key=value pairs
+
+    Used as the argparse ``type=`` for --config so malformed input is
+    rejected before any manager is constructed.
+    """
+    try:
+        config = json.loads(raw)
+    except json.JSONDecodeError:
+        config = {m.group(1).strip(): m.group(2).strip() for m in _KV_RE.finditer(raw)}
+        if not config and raw.strip():
+            raise argparse.ArgumentTypeError(f"invalid config: {raw!r}")
+        return config
+    if not isinstance(config, dict):
+        raise argparse.ArgumentTypeError("config JSON must be an object")
+    return config
+
+
+@contextlib.contextmanager
+def _block_buffered():
+    """Block-buffer stdout while a command runs, then flush once"""
+    if not hasattr(sys.stdout, 'reconfigure'):
+        yield
+        return
+
+    line_buffering = sys.stdout.line_buffering
+    sys.stdout.reconfigure(line_buffering=False)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        sys.stdout.reconfigure(line_buffering=line_buffering)
+
+
+def _dispatch(handler, args):
+    """Run a command handler with stdout block-buffered (errors are reported by main)"""
+    from core.logging_setup import setup_logging
+
+    # Only commands that actually run get the log file; help stays cheap
+    setup_logging()
+    with _block_buffered():
+        handler(args)
+
+
+def safe_datetime_now():
+    """Get current datetime with fallback for timestamp overflow"""
+    try:
+        return datetime.now()
+    except (OSError, OverflowError, ValueError):
+        return datetime(2025, 1, 1)
+
+
 # === COMMAND HANDLERS ===
 
 def cmd_status(args):
     """Show complete system status"""
-    print_header("NovaOS System Status")
-
-    monitor = get_monitor()
-    status = monitor.status()
-
-    # System overview
-    system = status['system']
-    print_section("System Health")
-    print(f"Health: {system['system_health']}")
-    print(f"Timestamp: {system['timestamp']}")
-
-    # Agents
-    agents = system['agents']
-    print_section("Agents")
-    print(f"Total: {agents['total']}")
-    print(f"  Active: {agents['active']}")
-    print(f"  Paused: {agents['paused']}")
-    print(f"  Killed: {agents['killed']}")
-    print(f"\nPerformance:")
-    print(f"  High Performers (ROI >300%): {agents['high_performers']}")
-    print(f"  Low Performers (ROI <100%): {agents['low_performers']}")
-    print(f"  Negative ROI: {agents['negative_performers']}")
-
-    # Financials
-    financials = system['financials']
-    print_section("Financials")
-    print(f"Revenue: {format_currency(financials['total_revenue'])}")
-    print(f"AI Costs: {format_currency(financials['total_costs'])}")
-    print(f"Profit: {format_currency(financials['profit'])}")
-    print(f"ROI: {format_percent(financials['roi'])}")
-    print(f"AI Cost %: {format_percent(financials['ai_cost_percent'])} (target: <5%)")
-
-    # Targets
-    targets = system['targets']
-    print_section("Target Tracking")
-    print(f"Monthly Target: {format_currency(targets['monthly_target'])}")
-    print(f"Current: {format_currency(targets['current_revenue'])}")
-    print(f"Progress: {format_percent(targets['percent_of_expected'])} of expected")
-    print(f"Status: {targets['status'].upper()}")
-
-    # Recommendations
-    if system['recommendations']:
-        print_section("Recommendations")
-        for i, rec in enumerate(system['recommendations'], 1):
-            print(f"{i}. {rec}")
-
-    # Cost alerts
-    cost_alerts = status['costs'].get('alerts', [])
-    if cost_alerts:
-        print_section("ALERTS")
-        for alert in cost_alerts:
-            print(f"[{alert['severity']}] {alert['message']}")
-            print(f"   Action: {alert['action']}")
+    from integrations.monitoring import get_monitor
+
+    out = Out()
+    try:
+        print_header("NovaOS System Status", out)
+
+        monitor = get_monitor()
+        status = monitor.status()
+
+        # System overview
+        system = status['system']
+        print_section("System Health", out)
+        out.p(f"Health: {system['system_health']}")
+        out.p(f"Timestamp: {system['timestamp']}")
+
+        # Agents
+        agents = system['agents']
+        print_section("Agents", out)
+        out.p(f"Total: {agents['total']}")
+        out.p(f"  Active: {agents['active']}")
+        out.p(f"  Paused: {agents['paused']}")
+        out.p(f"  Killed: {agents['killed']}")
+        out.p(f"\nPerformance:")
+        out.p(f"  High Performers (ROI >300%): {agents['high_performers']}")
+        out.p(f"  Low Performers (ROI <100%): {agents['low_performers']}")
+        out.p(f"  Negative ROI: {agents['negative_performers']}")
+
+        # Financials
+        financials = system['financials']
+        print_section("Financials", out)
+        out.p(f"Revenue: {format_currency(financials['total_revenue'])}")
+        out.p(f"AI Costs: {format_currency(financials['total_costs'])}")
+        out.p(f"Profit: {format_currency(financials['profit'])}")
+        out.p(f"ROI: {format_percent(financials['roi'])}")
+        out.p(f"AI Cost %: {format_percent(financials['ai_cost_percent'])} (target: <5%)")
+
+        # Targets
+        targets = system['targets']
+        print_section("Target Tracking", out)
+        out.p(f"Monthly Target: {format_currency(targets['monthly_target'])}")
+        out.p(f"Current: {format_currency(targets['current_revenue'])}")
+        out.p(f"Progress: {format_percent(targets['percent_of_expected'])} of expected")
+        out.p(f"Status: {targets['status'].upper()}")
+
+        # Recommendations
+        if system['recommendations']:
+            print_section("Recommendations", out)
+            for i, rec in enumerate(system['recommendations'], 1):
+                out.p(f"{i}. {rec}")
+
+        # Cost alerts
+        cost_alerts = status['costs'].get('alerts', [])
+        if cost_alerts:
+            print_section("ALERTS", out)
+            for alert in cost_alerts:
+                out.p(f"[{alert['severity']}] {alert['message']}")
+                out.p(f"   Action: {alert['action']}")
+    finally:
+        out.flush()
 
 
 def cmd_costs(args):
     """Show AI cost breakdown"""
-    print_header("AI Cost Dashboard")
-
-    monitor = get_monitor()
-    costs = monitor.costs(period=args.period if hasattr(args, 'period') else 'today')
-
-    # Summary
-    summary = costs['summary']
-    print_section("Summary")
-    print(f"Total Revenue: {format_currency(summary['total_revenue'])}")
-    print(f"Total AI Costs: {format_currency(summary['total_ai_costs'])}")
-    print(f"Net Profit: {format_currency(summary['net_profit'])}")
-    print(f"AI Cost %: {format_percent(summary['ai_cost_percent'])} (target: <5%)")
-    print(f"ROI: {format_percent(summary['overall_roi'])}")
-    print(f"Status: {summary['status']}")
-
-    # Cost breakdown by department
-    breakdown = costs['cost_breakdown']
-    if breakdown:
-        print_section("Cost Breakdown by Department")
-        for dept, data in breakdown.items():
-            print(f"{dept.title()}:")
-            print(f"  Cost: {format_currency(data['cost'])}")
-            print(f"  Tokens: {data['tokens']:,}")
-
-    # Most expensive agents
-    expensive = costs['most_expensive_agents']
-    if expensive:
-        print_section("Most Expensive Agents")
-        for i, agent in enumerate(expensive, 1):
-            print(f"{i}. {agent['name']} ({agent['department']})")
-            print(f"   Cost: {format_currency(agent['cost'])} | "
-                  f"Revenue: {format_currency(agent['revenue'])} | "
-                  f"ROI: {format_percent(agent['roi'])}")
-
-    # Alerts
-    alerts = costs.get('alerts', [])
-    if alerts:
-        print_section("ALERTS")
-        for alert in alerts:
-            print(f"[{alert['severity']}] {alert['message']}")
-            print(f"   Action: {alert['action']}")
+    from integrations.monitoring import get_monitor
+
+    out = Out()
+    try:
+        print_header("AI Cost Dashboard", out)
+
+        monitor = get_monitor()
+        costs = monitor.costs(period=args.period)
+
+        # Summary
+        summary = costs['summary']
+        print_section("Summary", out)
+        out.p(f"Total Revenue: {format_currency(summary['total_revenue'])}")
+        out.p(f"Total AI Costs: {format_currency(summary['total_ai_costs'])}")
+        out.p(f"Net Profit: {format_currency(summary['net_profit'])}")
+        out.p(f"AI Cost %: {format_percent(summary['ai_cost_percent'])} (target: <5%)")
+        out.p(f"ROI: {format_percent(summary['overall_roi'])}")
+        out.p(f"Status: {summary['status']}")
+
+        # Cost breakdown by department
+        breakdown = costs['cost_breakdown']
+        if breakdown:
+            print_section("Cost Breakdown by Department", out)
+            for dept, data in breakdown.items():
+                out.p(f"{dept.title()}:")
+                out.p(f"  Cost: ${data['cost']:,.2f}")
+                out.p(f"  Tokens: {data['tokens']:,}")
+
+        # Most expensive agents
+        expensive = costs['most_expensive_agents']
+        if expensive:
+            print_section("Most Expensive Agents", out)
+            for i, agent in enumerate(expensive, 1):
+                out.p(f"{i}. {agent['name']} ({agent['department']})")
+                out.p(f"   Cost: ${agent['cost']:,.2f} | "
+                      f"Revenue: ${agent['revenue']:,.2f} | "
+                      f"ROI: {agent['roi']:.1f}%")
+
+        # Alerts
+        alerts = costs.get('alerts', [])
+        if alerts:
+            print_section("ALERTS", out)
+            for alert in alerts:
+                out.p(f"[{alert['severity']}] {alert['message']}")
+                out.p(f"   Action: {alert['action']}")
+    finally:
+        out.flush()
 
 
 def cmd_revenue(args):
     """Show revenue tracking"""
-    print_header("Revenue Dashboard")
-
-    monitor = get_monitor()
-    revenue = monitor.revenue()
-
-    print_section("Summary")
-    print(f"Total Revenue: {format_currency(revenue['total_revenue'])}")
-    print(f"Monthly Target: {format_currency(revenue['monthly_target'])}")
-    print(f"Daily Target: {format_currency(revenue['daily_target'])}")
-    print(f"Profit: {format_currency(revenue['profit'])}")
-    print(f"Burn Rate: {format_currency(revenue['burn_rate'])}")
-
-    # Tracking
-    tracking = revenue['tracking']
-    print_section("Target Tracking")
-    print(f"Status: {tracking['status'].upper()}")
-    print(f"Progress: {format_percent(tracking['percent_of_expected'])} of expected")
-    print(f"On Track: {'YES' if tracking['on_track'] else 'NO'}")
-
-    # Department breakdown
-    dept_revenue = revenue['department_breakdown']
-    if dept_revenue:
-        print_section("Revenue by Department")
-        for dept, amount in sorted(dept_revenue.items(), key=lambda x: x[1], reverse=True):
-            print(f"{dept.title()}: {format_currency(amount)}")
-
-    # Top agents
-    top_agents = revenue['top_revenue_generators']
-    if top_agents:
-        print_section("Top Revenue Generators")
-        for i, agent in enumerate(top_agents, 1):
-            print(f"{i}. {agent['name']} ({agent['department']})")
-            print(f"   Revenue: {format_currency(agent['revenue'])} | "
-                  f"Cost: {format_currency(agent['cost'])} | "
-                  f"ROI: {format_percent(agent['roi'])}")
-
-    # Recommendations
-    if revenue.get('recommendations'):
-        print_section("Recommendations")
-        for i, rec in enumerate(revenue['recommendations'], 1):
-            print(f"{i}. {rec}")
+    from integrations.monitoring import get_monitor
+
+    out = Out()
+    try:
+        print_header("Revenue Dashboard", out)
+
+        monitor = get_monitor()
+        revenue = monitor.revenue()
+
+        print_section("Summary", out)
+        out.p(f"Total Revenue: {format_currency(revenue['total_revenue'])}")
+        out.p(f"Monthly Target: {format_currency(revenue['monthly_target'])}")
+        out.p(f"Daily Target: {format_currency(revenue['daily_target'])}")
+        out.p(f"Profit: {format_currency(revenue['profit'])}")
+        out.p(f"Burn Rate: {format_currency(revenue['burn_rate'])}")
+
+        # Tracking
+        tracking = revenue['tracking']
+        print_section("Target Tracking", out)
+        out.p(f"Status: {tracking['status'].upper()}")
+        out.p(f"Progress: {format_percent(tracking['percent_of_expected'])} of expected")
+        out.p(f"On Track: {'YES' if tracking['on_track'] else 'NO'}")
+
+        # Department breakdown
+        dept_revenue = revenue['department_breakdown']
+        if dept_revenue:
+            print_section("Revenue by Department", out)
+            for dept, amount in sorted(dept_revenue.items(), key=itemgetter(1), reverse=True):
+                out.p(f"{dept.title()}: ${amount:,.2f}")
+
+        # Top agents
+        top_agents = revenue['top_revenue_generators']
+        if top_agents:
+            print_section("Top Revenue Generators", out)
+            for i, agent in enumerate(top_agents, 1):
+                out.p(f"{i}. {agent['name']} ({agent['department']})")
+                out.p(f"   Revenue: ${agent['revenue']:,.2f} | "
+                      f"Cost: ${agent['cost']:,.2f} | "
+                      f"ROI: {agent['roi']:.1f}%")
+
+        # Recommendations
+        if revenue.get('recommendations'):
+            print_section("Recommendations", out)
+            for i, rec in enumerate(revenue['recommendations'], 1):
+                out.p(f"{i}. {rec}")
+    finally:
+        out.flush()
 
 
 def cmd_board_status(args):
     """Show board agent status"""
+    from core.board import get_board
+
     print_header("Board Status")
 
     board = get_board()
@@ -217,6 +338,8 @@ def cmd_board_status(args):
 
 def cmd_board_decide(args):
     """Make a board decision"""
+    from core.board import get_board
+
     print_header("CEO Decision")
 
     board = get_board()
@@ -230,6 +353,9 @@ def cmd_board_decide(args):
 
 def cmd_deploy(args):
     """Deploy an agent"""
+    from core.departments import get_departments
+    from core.agent_factory import get_factory
+
     print_header(f"Deploying {args.agent_type} Agent")
 
     factory = get_factory()
@@ -239,20 +365,11 @@ def cmd_deploy(args):
     dept = departments.get_department(args.department)
     if not dept:
         print(f"Error: Unknown department '{args.department}'")
-        print("Available: sales, marketing, product, operations, research")
+        print(f"Available: {', '.join(KNOWN_DEPARTMENTS)}")
         return
 
-    # Parse config
-    config = {}
-    if hasattr(args, 'config') and args.config:
-        try:
-            config = json.loads(args.config)
-        except:
-            # Try as key=value pairs
-            for pair in args.config.split(','):
-                if '=' in pair:
-                    key, value = pair.split('=', 1)
-                    config[key.strip()] = value.strip()
+    # --config is parsed by argparse (see _parse_config)
+    config = args.config or {}
 
     # Special handling for templates
     if args.agent_type == 'dds' and args.department == 'sales':
@@ -261,9 +378,11 @@ def cmd_deploy(args):
         return
 
     # Deploy generic agent
+    now = safe_datetime_now()
+    suffix = f"{now.year}{now.month:02d}{now.day:02d}-{now.hour:02d}{now.minute:02d}{now.second:02d}"
     agent_id = factory.deploy_agent(
         agent_type=args.agent_type,
-        name=f"{args.agent_type}-{safe_datetime_now().strftime('%Y%m%d-%H%M%S')}",
+        name=f"{args.agent_type}-{suffix}",
         department=args.department,
         config=config
     )
@@ -274,38 +393,33 @@ def cmd_deploy(args):
 
 def cmd_agents_list(args):
     """List all agents"""
-    print_header("Agent List")
-
-    factory = get_factory()
-
-    status_filter = args.status if hasattr(args, 'status') else None
-    dept_filter = args.department if hasattr(args, 'department') else None
+    from core.agent_factory import get_factory
 
-    agents = factory.list_agents(status=status_filter, department=dept_filter)
+    out = Out()
+    try:
+        print_header("Agent List", out)
 
-    if not agents:
-        print("No agents found")
-        return
+        factory = get_factory()
 
-    print(f"Found {len(agents)} agents\n")
+        agents = factory.list_agents(status=args.status, department=args.department)
 
-    for agent in agents:
-        status_icon = {
-            'active': '▶',
-            'paused': '⏸',
-            'killed': '⨯'
-        }.get(agent['status'], '?')
+        if not agents:
+            out.p("No agents found")
+            return
 
-        print(f"{status_icon} {agent['name']} ({agent['agent_id']})")
-        print(f"   Type: {agent['type']} | Dept: {agent['department']} | Status: {agent['status']}")
-        print(f"   Cost: {format_currency(agent['cost'])} | "
-              f"Revenue: {format_currency(agent['revenue'])} | "
-              f"ROI: {format_percent(agent['roi'])}")
-        print()
+        out.p(f"Found {len(agents)} agents\n")
+        out.p("\n".join(
+            _AGENT_ROW.format_map({**agent, 'icon': _AGENT_ICON.get(agent['status'], '?')})
+            for agent in agents
+        ))
+    finally:
+        out.flush()
 
 
 def cmd_agent_status(args):
     """Show detailed agent status"""
+    from core.agent_factory import get_factory
+
     print_header(f"Agent Status: {args.agent_id}")
 
     factory = get_factory()
@@ -339,31 +453,58 @@ def cmd_agent_status(args):
 
 def cmd_agent_pause(args):
     """Pause an agent"""
+    from core.agent_factory import get_factory
+
     factory = get_factory()
-    factory.pause_agent(args.agent_id)
+    if not factory.pause_agent(args.agent_id):
+        print(f"Error: Agent {args.agent_id} not found")
+        return
+
+    agent = factory.memory.get_agent(args.agent_id)
+    print(f"⏸ Paused agent: {agent['name']} ({args.agent_id})")
 
 
 def cmd_agent_resume(args):
     """Resume an agent"""
+    from core.agent_factory import get_factory
+
     factory = get_factory()
-    factory.resume_agent(args.agent_id)
+    if not factory.resume_agent(args.agent_id):
+        print(f"Error: Agent {args.agent_id} not found")
+        return
+
+    agent = factory.memory.get_agent(args.agent_id)
+    print(f"▶ Resumed agent: {agent['name']} ({args.agent_id})")
 
 
 def cmd_agent_kill(args):
     """Kill an agent"""
+    from core.agent_factory import get_factory
+
     factory = get_factory()
-    factory.kill_agent(args.agent_id)
+    if not factory.kill_agent(args.agent_id):
+        print(f"Error: Agent {args.agent_id} not found")
+        return
+
+    agent = factory.memory.get_agent(args.agent_id)
+    print(f"⨯ Killed agent: {agent['name']} ({args.agent_id})")
+    print(f"  Final stats: Cost ${agent.get('total_cost', 0):.2f}, "
+          f"Revenue ${agent.get('revenue_generated', 0):.2f}, "
+          f"ROI {agent.get('roi', 0):.1f}%")
 
 
 def cmd_roi(args):
     """Show ROI for agent or department"""
-    print_header(f"ROI Report: {args.target}")
+    from core.agent_factory import get_factory
 
-    memory = get_memory()
+    print_header(f"ROI Report: {args.target}")
 
-    # Check if it's a department or agent
-    departments = get_departments()
-    dept = departments.get_department(args.target)
+    # Department names are bare words; agent IDs look like "<type>_<hex>", so
+    # only build the department registry when the target could be one
+    dept = None
+    if _DEPARTMENT_NAME_RE.fullmatch(args.target):
+        from core.departments import get_departments
+        dept = get_departments().get_department(args.target)
 
     if dept:
         # Department ROI
@@ -378,7 +519,7 @@ def cmd_roi(args):
     else:
         # Agent ROI
         factory = get_factory()
-        status = factory.get_agent_status(args.target)
+        status = factory.get_agent_status(args.target, include_config=False)
 
         if not status:
             print(f"Error: '{args.target}' not found (not a department or agent ID)")
@@ -395,6 +536,8 @@ def cmd_roi(args):
 
 def cmd_optimize(args):
     """Run cost optimization"""
+    from core.agent_factory import get_factory
+
     print_header("Cost Optimization")
 
     factory = get_factory()
@@ -452,36 +595,44 @@ def cmd_council(args):
 
 def cmd_sandbox_status(args):
     """Show sandbox environment status"""
-    print_header("Sandbox Environment")
+    from sandbox.manager import get_sandbox
 
-    sandbox = get_sandbox()
-    summary = sandbox.get_summary()
-
-    print_section("Summary")
-    print(f"Total Projects: {summary['total_projects']}")
-    print(f"  Active: {summary['active_projects']}")
-    print(f"  Promoted: {summary['promoted_projects']}")
-    print(f"Total Agents: {summary['total_agents']}")
-    print(f"Total Cost: {format_currency(summary['total_cost'])}")
-    print(f"\nNote: Sandbox costs are isolated (not tracked in production)")
-
-    if summary['projects']:
-        print_section("Projects")
-        for project in summary['projects']:
-            status_icon = {'active': '▶', 'promoted': '✓', 'deleted': '⨯'}.get(project['status'], '?')
-            print(f"{status_icon} {project['name']} ({project['id']})")
-            print(f"   Status: {project['status']} | Created: {project['created_at'][:10]}")
-
-            if 'metrics' in project:
-                metrics = project['metrics']
-                print(f"   Agents: {metrics['total_agents']} | "
-                      f"Cost: {format_currency(metrics['total_cost'])} | "
-                      f"ROI: {format_percent(metrics['roi'])}")
-            print()
+    out = Out()
+    try:
+        print_header("Sandbox Environment", out)
+
+        sandbox = get_sandbox()
+        summary = sandbox.get_summary()
+
+        print_section("Summary", out)
+        out.p(f"Total Projects: {summary['total_projects']}")
+        out.p(f"  Active: {summary['active_projects']}")
+        out.p(f"  Promoted: {summary['promoted_projects']}")
+        out.p(f"Total Agents: {summary['total_agents']}")
+        out.p(f"Total Cost: {format_currency(summary['total_cost'])}")
+        out.p(f"\nNote: Sandbox costs are isolated (not tracked in production)")
+
+        if summary['projects']:
+            print_section("Projects", out)
+            for project in summary['projects']:
+                status_icon = _PROJECT_ICON.get(project['status'], '?')
+                out.p(f"{status_icon} {project['name']} ({project['id']})")
+                out.p(f"   Status: {project['status']} | Created: {project['created_at'][:10]}")
+
+                if 'metrics' in project:
+                    metrics = project['metrics']
+                    out.p(f"   Agents: {metrics['total_agents']} | "
+                          f"Cost: ${metrics['total_cost']:,.2f} | "
+                          f"ROI: {metrics['roi']:.1f}%")
+                out.p()
+    finally:
+        out.flush()
 
 
 def cmd_sandbox_create(args):
     """Create a new sandbox project"""
+    from sandbox.manager import get_sandbox
+
     print_header("Create Sandbox Project")
 
     sandbox = get_sandbox()
@@ -497,89 +648,95 @@ def cmd_sandbox_create(args):
 
 def cmd_sandbox_list(args):
     """List sandbox projects"""
-    print_header("Sandbox Projects")
+    from sandbox.manager import get_sandbox
 
-    sandbox = get_sandbox()
-    projects = sandbox.list_projects()
+    out = Out()
+    try:
+        print_header("Sandbox Projects", out)
 
-    if not projects:
-        print("No sandbox projects found")
-        print("\nCreate one: nova sandbox create <name>")
-        return
+        sandbox = get_sandbox()
+        projects = sandbox.list_projects()
 
-    for project in projects:
-        status_icon = {'active': '▶', 'promoted': '✓', 'deleted': '⨯'}.get(project['status'], '?')
-        print(f"\n{status_icon} {project['name']}")
-        print(f"   ID: {project['id']}")
-        print(f"   Status: {project['status']}")
-        print(f"   Created: {project['created_at']}")
+        if not projects:
+            out.p("No sandbox projects found")
+            out.p("\nCreate one: nova sandbox create <name>")
+            return
 
-        if project.get('description'):
-            print(f"   Description: {project['description']}")
+        for project in projects:
+            status_icon = _PROJECT_ICON.get(project['status'], '?')
+            out.p(f"\n{status_icon} {project['name']}")
+            out.p(f"   ID: {project['id']}")
+            out.p(f"   Status: {project['status']}")
+            out.p(f"   Created: {project['created_at']}")
 
-        if 'metrics' in project:
-            metrics = project['metrics']
-            print(f"   Metrics:")
-            print(f"     Agents: {metrics['total_agents']} ({metrics['active_agents']} active)")
-            print(f"     Cost: {format_currency(metrics['total_cost'])}")
-            print(f"     Revenue: {format_currency(metrics['total_revenue'])}")
-            print(f"     ROI: {format_percent(metrics['roi'])}")
+            if project.get('description'):
+                out.p(f"   Description: {project['description']}")
+
+            if 'metrics' in project:
+                metrics = project['metrics']
+                out.p(f"   Metrics:")
+                out.p(f"     Agents: {metrics['total_agents']} ({metrics['active_agents']} active)")
+                out.p(f"     Cost: ${metrics['total_cost']:,.2f}")
+                out.p(f"     Revenue: ${metrics['total_revenue']:,.2f}")
+                out.p(f"     ROI: {metrics['roi']:.1f}%")
+    finally:
+        out.flush()
 
 
 def cmd_sandbox_project(args):
     """Show sandbox project details"""
-    print_header(f"Sandbox Project: {args.project_id}")
+    from sandbox.manager import get_sandbox
 
-    sandbox = get_sandbox()
-    project = sandbox.get_project(args.project_id)
-
-    if not project:
-        print(f"Error: Project {args.project_id} not found")
-        return
+    out = Out()
+    try:
+        print_header(f"Sandbox Project: {args.project_id}", out)
 
-    print(f"Name: {project.name}")
-    print(f"ID: {project.project_id}")
-    print(f"Description: {project.description or 'None'}")
-    print(f"Workspace: {project.workspace_path}")
+        sandbox = get_sandbox()
+        project = sandbox.get_project(args.project_id)
 
-    metrics = project.get_metrics()
-    print_section("Metrics")
-    print(f"Total Agents: {metrics['total_agents']}")
-    print(f"Active Agents: {metrics['active_agents']}")
-    print(f"Total Cost: {format_currency(metrics['total_cost'])}")
-    print(f"Total Revenue: {format_currency(metrics['total_revenue'])}")
-    print(f"Profit: {format_currency(metrics['profit'])}")
-    print(f"ROI: {format_percent(metrics['roi'])}")
+        if not project:
+            out.p(f"Error: Project {args.project_id} not found")
+            return
 
-    agents = project.list_agents()
-    if agents:
-        print_section("Agents")
-        for agent in agents:
-            status_icon = {'active': '▶', 'paused': '⏸', 'killed': '⨯'}.get(agent['status'], '?')
-            print(f"{status_icon} {agent['name']} ({agent['id']})")
-            print(f"   Type: {agent['type']} | Status: {agent['status']}")
-            print(f"   Cost: {format_currency(agent.get('total_cost', 0))} | "
-                  f"ROI: {format_percent(agent.get('roi', 0))}")
+        out.p(f"Name: {project.name}")
+        out.p(f"ID: {project.project_id}")
+        out.p(f"Description: {project.description or 'None'}")
+        out.p(f"Workspace: {project.workspace_path}")
+
+        metrics = project.get_metrics()
+        print_section("Metrics", out)
+        out.p(f"Total Agents: {metrics['total_agents']}")
+        out.p(f"Active Agents: {metrics['active_agents']}")
+        out.p(f"Total Cost: {format_currency(metrics['total_cost'])}")
+        out.p(f"Total Revenue: {format_currency(metrics['total_revenue'])}")
+        out.p(f"Profit: {format_currency(metrics['profit'])}")
+        out.p(f"ROI: {format_percent(metrics['roi'])}")
+
+        agents = project.list_agents()
+        if agents:
+            print_section("Agents", out)
+            for agent in agents:
+                status_icon = _AGENT_ICON.get(agent['status'], '?')
+                out.p(f"{status_icon} {agent['name']} ({agent['id']})")
+                out.p(f"   Type: {agent['type']} | Status: {agent['status']}")
+                out.p(f"   Cost: ${agent.get('total_cost', 0):,.2f} | "
+                      f"ROI: {agent.get('roi', 0):.1f}%")
+    finally:
+        out.flush()
 
 
 def cmd_sandbox_deploy(args):
     """Deploy an agent in a sandbox project"""
+    from sandbox.manager import get_sandbox
+
     print_header("Deploy Sandbox Agent")
 
     sandbox = get_sandbox()
 
-    # Parse config
-    config = {}
-    if hasattr(args, 'config') and args.config:
-        try:
-            config = json.loads(args.config)
-        except:
-            for pair in args.config.split(','):
-                if '=' in pair:
-                    key, value = pair.split('=', 1)
-                    config[key.strip()] = value.strip()
-
-    if hasattr(args, 'name') and args.name:
+    # --config is parsed by argparse (see _parse_config)
+    config = args.config or {}
+
+    if args.name:
         config['name'] = args.name
 
     agent_id = sandbox.deploy_agent(args.project_id, args.agent_type, config)
@@ -591,7 +748,9 @@ def cmd_sandbox_deploy(args):
 
 def cmd_sandbox_eval(args):
     """Evaluate a sandbox project"""
-    use_council = getattr(args, 'council', False)
+    from sandbox.manager import get_sandbox
+
+    use_council = args.council
 
     if use_council:
         print_header(f"Comprehensive Evaluation (R&D Council): {args.project_id}")
@@ -628,12 +787,7 @@ def cmd_sandbox_eval(args):
 
         # Show each avatar's view
         print("Expert Perspectives:\n")
-        avatars = {'thiel': 'Thiel (Contrarian/Monopoly)',
-                  'musk': 'Musk (First Principles/Speed)',
-                  'graham': 'Graham (Fundamentals/PMF)',
-                  'taleb': 'Taleb (Risk/Antifragility)'}
-
-        for key, name in avatars.items():
+        for key, name in _AVATARS:
             print(f"{name}:")
             print(f"  {council['analyses'][key]}\n")
 
@@ -686,6 +840,8 @@ def cmd_sandbox_eval(args):
 
 def cmd_sandbox_promote(args):
     """Promote a sandbox project to production"""
+    from sandbox.manager import get_sandbox
+
     print_header(f"Promote Project to Production")
 
     sandbox = get_sandbox()
@@ -709,6 +865,8 @@ def cmd_sandbox_promote(args):
 
 def cmd_sandbox_kill(args):
     """Kill a sandbox project"""
+    from sandbox.manager import get_sandbox
+
     sandbox = get_sandbox()
 
     confirm = input(f"Kill project {args.project_id}? (yes/no): ")
@@ -716,11 +874,7 @@ def cmd_sandbox_kill(args):
         print("Cancelled")
         return
 
-    delete_workspace = False
-    if hasattr(args, 'delete') and args.delete:
-        delete_workspace = True
-
-    success = sandbox.kill_project(args.project_id, delete_workspace)
+    success = sandbox.kill_project(args.project_id, args.delete)
 
     if success:
         print(f"✓ Project killed")
@@ -730,9 +884,39 @@ def cmd_sandbox_kill(args):
 
 # === DASHBOARD COMMANDS ===
 
+def _listening(port: int) -> bool:
+    """True if something accepts TCP connections on localhost:port"""
+    import socket
+
+    try:
+        socket.create_connection(("localhost", port), timeout=0.2).close()
+        return True
+    except OSError:
+        return False
+
+
+def _probe_dashboard(port: int):
+    """Fetch /api/overview from a local dashboard; None if nothing answers"""
+    import http.client
+
+    if not _listening(port):
+        return None
+
+    conn = http.client.HTTPConnection("localhost", port, timeout=1)
+    try:
+        conn.request("GET", "/api/overview")
+        response = conn.getresponse()
+        if response.status != 200:
+            return None
+        return json.loads(response.read())
+    except (OSError, http.client.HTTPException, ValueError):
+        return None
+    finally:
+        conn.close()
+
+
 def cmd_dashboard_start(args):
     """Start the dashboard server"""
-    import subprocess
     import os
     from pathlib import Path
 
@@ -748,50 +932,79 @@ def cmd_dashboard_start(args):
     port = 5001
 
     # Check if already running
-    try:
-        import requests
-        response = requests.get(f"http://localhost:{port}/api/overview", timeout=1)
-        if response.status_code == 200:
-            print(f"Dashboard is already running at http://localhost:{port}")
-            return
-    except:
-        pass
+    if _probe_dashboard(port) is not None:
+        print(f"Dashboard is already running at http://localhost:{port}")
+        return
+
+    if args.detach:
+        import subprocess
+
+        process = subprocess.Popen(
+            [sys.executable, "app.py"],
+            cwd=dashboard_dir,
+            start_new_session=True
+        )
+        print(f"\n✓ Dashboard started in background on http://localhost:{port} (PID: {process.pid})")
+        print("  Stop with: nova dashboard stop")
+        return
 
     print(f"\n✓ Starting Flask server on http://localhost:{port}")
     print("  Press Ctrl+C to stop\n")
 
-    # Start the dashboard
+    # Replace the CLI process with the dashboard server
+    sys.stdout.flush()
+    # exec skips atexit, so write out queued/buffered log records now
+    from core.logging_setup import shutdown_logging
+    shutdown_logging()
     os.chdir(dashboard_dir)
-    subprocess.run([sys.executable, "app.py"])
-
+    os.execvp(sys.executable, [sys.executable, "app.py"])
 
-def cmd_dashboard_stop(args):
-    """Stop the dashboard server"""
-    import subprocess
-    import signal
 
-    print_header("Stopping NovaOS Dashboard")
+def _listening_pid(ports):
+    """PID listening on the first of ports that has a listener, or None"""
+    import psutil
 
-    # Find and kill Flask process (try both port 5001 and 5000)
     try:
-        # Try port 5001 first (default)
-        result = subprocess.run(
-            ["lsof", "-ti:5001"],
-            capture_output=True,
-            text=True
-        )
+        connections = psutil.net_connections(kind='tcp')
+    except psutil.AccessDenied:
+        # macOS only exposes other processes' sockets to root; ask lsof instead
+        import subprocess
 
-        if not result.stdout.strip():
-            # Try port 5000 as fallback
+        for port in ports:
             result = subprocess.run(
-                ["lsof", "-ti:5000"],
+                ["lsof", "-t", f"-iTCP:{port}", "-sTCP:LISTEN"],
                 capture_output=True,
                 text=True
             )
+            pids = result.stdout.split()
+            if pids:
+                return int(pids[0])
+        return None
+
+    listeners = {
+        conn.laddr.port: conn.pid
+        for conn in connections
+        if conn.status == psutil.CONN_LISTEN and conn.laddr and conn.pid
+    }
+    for port in ports:
+        if port in listeners:
+            return listeners[port]
+    return None
+
 
-        if result.stdout.strip():
-            pid = result.stdout.strip()
-            subprocess.run(["kill", pid])
+def cmd_dashboard_stop(args):
+    """Stop the dashboard server"""
+    import os
+    import signal
+
+    print_header("Stopping NovaOS Dashboard")
+
+    # Find and kill Flask process (port 5001 is the default, 5000 the fallback)
+    try:
+        pid = _listening_pid((5001, 5000))
+
+        if pid:
+            os.kill(pid, signal.SIGTERM)
             print(f"✓ Dashboard stopped (PID: {pid})")
         else:
             print("Dashboard is not running")
@@ -804,29 +1017,20 @@ def cmd_dashboard_status(args):
     print_header("Dashboard Status")
 
     try:
-        import requests
-
         # Try port 5001 first (default), then 5000
         for port in [5001, 5000]:
-            try:
-                response = requests.get(f"http://localhost:{port}/api/overview", timeout=1)
-                if response.status_code == 200:
-                    print("✓ Dashboard is RUNNING")
-                    print(f"  URL: http://localhost:{port}")
-
-                    data = response.json()
-                    print(f"\n  System Health: {data['system_health']}")
-                    print(f"  Active Agents: {data['active_agents']}")
-                    return
-            except requests.exceptions.ConnectionError:
-                continue
+            data = _probe_dashboard(port)
+            if data is not None:
+                print("✓ Dashboard is RUNNING")
+                print(f"  URL: http://localhost:{port}")
+
+                print(f"\n  System Health: {data['system_health']}")
+                print(f"  Active Agents: {data['active_agents']}")
+                return
 
         print("✗ Dashboard is NOT RUNNING")
         print("\nTo start: nova dashboard start")
 
-    except ImportError:
-        print("Error: requests library not installed")
-        print("Run: pip install requests")
     except Exception as e:
         print(f"Error checking status: {e}")
 
@@ -835,6 +1039,8 @@ def cmd_dashboard_status(args):
 
 def cmd_workers_start(args):
     """Start all background workers"""
+    from workers.manager import get_worker_manager
+
     print_header("Starting Background Workers")
 
     manager = get_worker_manager()
@@ -856,6 +1062,8 @@ def cmd_workers_start(args):
 
 def cmd_workers_stop(args):
     """Stop all background workers"""
+    from workers.manager import get_worker_manager
+
     print_header("Stopping Background Workers")
 
     manager = get_worker_manager()
@@ -866,37 +1074,52 @@ def cmd_workers_stop(args):
 
 def cmd_workers_status(args):
     """Show worker status"""
-    print_header("Background Workers Status")
+    from workers.manager import get_worker_manager
 
-    manager = get_worker_manager()
-    monitor = get_worker_monitor()
+    out = Out()
+    try:
+        print_header("Background Workers Status", out)
 
-    status = manager.get_status()
+        manager = get_worker_manager()
 
-    print_section("Overview")
-    print(f"Total Workers: {status['workers']['total']}")
-    print(f"  Running: {status['workers']['running']}")
-    print(f"  Paused: {status['workers']['paused']}")
-    print(f"  Stopped: {status['workers']['stopped']}")
-    print(f"  Crashed: {status['workers']['crashed']}")
+        status = manager.get_status()
 
-    print_section("Performance")
-    print(f"Total Revenue: {format_currency(status['metrics']['total_revenue'])}")
-    print(f"Total Cost: {format_currency(status['metrics']['total_cost'])}")
-    print(f"Profit: {format_currency(status['metrics']['profit'])}")
-    print(f"ROI: {format_percent(status['metrics']['roi'])}")
+        workers = status['workers']
+        print_section("Overview", out)
+        out.p(f"Total Workers: {workers['total']}")
+        out.p(f"  Running: {workers['running']}")
+        out.p(f"  Paused: {workers['paused']}")
+        out.p(f"  Stopped: {workers['stopped']}")
+        out.p(f"  Crashed: {workers['crashed']}")
 
-    print_section("Workers")
-    for worker_status in status['workers_detail']:
-        print(f"\n[{worker_status['worker_id']}] {worker_status['name']}")
-        print(f"  Status: {worker_status['status']}")
-        print(f"  Uptime: {worker_status['uptime']}")
-        print(f"  ROI: {format_percent(worker_status['metrics']['roi'])}")
-        print(f"  Profit: {format_currency(worker_status['metrics']['profit'])}")
+        metrics = status['metrics']
+        print_section("Performance", out)
+        out.p(f"Total Revenue: {format_currency(metrics['total_revenue'])}")
+        out.p(f"Total Cost: {format_currency(metrics['total_cost'])}")
+        out.p(f"Profit: {format_currency(metrics['profit'])}")
+        out.p(f"ROI: {format_percent(metrics['roi'])}")
+
+        print_section("Workers", out)
+        if status['workers_detail']:
+            out.p("\n".join(
+                _WORKER_ROW.format(
+                    worker_id=worker['worker_id'],
+                    name=worker['name'],
+                    status=worker['status'],
+                    uptime=worker['uptime'],
+                    roi=worker['metrics']['roi'],
+                    profit=worker['metrics']['profit']
+                )
+                for worker in status['workers_detail']
+            ))
+    finally:
+        out.flush()
 
 
 def cmd_workers_scale(args):
     """Scale a worker"""
+    from workers.manager import get_worker_manager
+
     print_header(f"Scaling Worker: {args.worker_id}")
 
     manager = get_worker_manager()
@@ -910,29 +1133,37 @@ def cmd_workers_scale(args):
 
 def cmd_workers_health(args):
     """Check worker health"""
-    print_header("Worker Health Check")
+    from workers.manager import get_worker_manager
 
-    manager = get_worker_manager()
-    health = manager.health_check()
+    out = Out()
+    try:
+        print_header("Worker Health Check", out)
+
+        manager = get_worker_manager()
+        health = manager.health_check()
 
-    print(f"Healthy Workers: {health['healthy']}")
-    print(f"Unhealthy Workers: {health['unhealthy']}")
+        out.p(f"Healthy Workers: {health['healthy']}")
+        out.p(f"Unhealthy Workers: {health['unhealthy']}")
 
-    if health['unhealthy_workers']:
-        print_section("Unhealthy Workers")
-        for worker_id in health['unhealthy_workers']:
-            print(f"  - {worker_id}")
+        if health['unhealthy_workers']:
+            print_section("Unhealthy Workers", out)
+            for worker_id in health['unhealthy_workers']:
+                out.p(f"  - {worker_id}")
 
-    if health['needs_restart']:
-        print_section("Needs Restart")
-        for worker_id in health['needs_restart']:
-            print(f"  - {worker_id}")
+        if health['needs_restart']:
+            print_section("Needs Restart", out)
+            for worker_id in health['needs_restart']:
+                out.p(f"  - {worker_id}")
+    finally:
+        out.flush()
 
 
 # === AUTONOMOUS COMMANDS ===
 
 def cmd_autonomous_enable(args):
     """Enable autonomous mode"""
+    from core.autonomous import get_autonomous_engine
+
     print_header("Enabling Autonomous Mode")
 
     engine = get_autonomous_engine()
@@ -948,6 +1179,8 @@ def cmd_autonomous_enable(args):
 
 def cmd_autonomous_disable(args):
     """Disable autonomous mode"""
+    from core.autonomous import get_autonomous_engine
+
     print_header("Disabling Autonomous Mode")
 
     engine = get_autonomous_engine()
@@ -958,126 +1191,119 @@ def cmd_autonomous_disable(args):
 
 def cmd_autonomous_status(args):
     """Show autonomous engine status"""
-    print_header("Autonomous Engine Status")
-
-    engine = get_autonomous_engine()
-    status = engine.get_status()
-
-    print_section("Status")
-    print(f"Enabled: {'YES' if status['enabled'] else 'NO'}")
-
-    print_section("Configuration")
-    print(f"Max Daily Budget: {format_currency(status['config']['max_daily_budget'])}")
-    print(f"Min ROI Threshold: {format_percent(status['config']['min_roi_threshold'])}")
-    print(f"Scale ROI Threshold: {format_percent(status['config']['scale_roi_threshold'])}")
-    print(f"Kill ROI Threshold: {format_percent(status['config']['kill_roi_threshold'])}")
-
-    print_section("Budget")
-    print(f"Spent Today: {format_currency(status['budget']['spent_today'])}")
-    print(f"Remaining: {format_currency(status['budget']['remaining'])}")
-    print(f"Usage: {format_percent(status['budget']['percent_used'])}")
+    from core.autonomous import get_autonomous_engine
 
-    print_section("Decisions")
-    print(f"Total Decisions: {status['decisions']['total']}")
-    print(f"Today: {status['decisions']['today']}")
-    print(f"Pending Approvals: {status['decisions']['pending_approvals']}")
-
-    if status['pending_approvals']:
-        print_section("Pending Approvals")
-        for approval in status['pending_approvals']:
-            print(f"\n  Type: {approval['type']}")
-            print(f"  Target: {approval['target']}")
-            print(f"  Reason: {approval['reason']}")
-            print(f"  Expected ROI: {format_percent(approval['expected_roi'])}")
-            print(f"  Cost Impact: {format_currency(approval['cost_impact'])}")
+    out = Out()
+    try:
+        print_header("Autonomous Engine Status", out)
+
+        engine = get_autonomous_engine()
+        status = engine.get_status()
+
+        print_section("Status", out)
+        out.p(f"Enabled: {'YES' if status['enabled'] else 'NO'}")
+
+        config = status['config']
+        print_section("Configuration", out)
+        out.p(f"Max Daily Budget: {format_currency(config['max_daily_budget'])}")
+        out.p(f"Min ROI Threshold: {format_percent(config['min_roi_threshold'])}")
+        out.p(f"Scale ROI Threshold: {format_percent(config['scale_roi_threshold'])}")
+        out.p(f"Kill ROI Threshold: {format_percent(config['kill_roi_threshold'])}")
+
+        budget = status['budget']
+        print_section("Budget", out)
+        out.p(f"Spent Today: {format_currency(budget['spent_today'])}")
+        out.p(f"Remaining: {format_currency(budget['remaining'])}")
+        out.p(f"Usage: {format_percent(budget['percent_used'])}")
+
+        decisions = status['decisions']
+        print_section("Decisions", out)
+        out.p(f"Total Decisions: {decisions['total']}")
+        out.p(f"Today: {decisions['today']}")
+        out.p(f"Pending Approvals: {decisions['pending_approvals']}")
+
+        if status['pending_approvals']:
+            print_section("Pending Approvals", out)
+            for approval in status['pending_approvals']:
+                out.p(f"\n  Type: {approval['type']}")
+                out.p(f"  Target: {approval['target']}")
+                out.p(f"  Reason: {approval['reason']}")
+                out.p(f"  Expected ROI: {approval['expected_roi']:.1f}%")
+                out.p(f"  Cost Impact: ${approval['cost_impact']:,.2f}")
+    finally:
+        out.flush()
 
 
 def cmd_autonomous_run(args):
     """Run autonomous analysis cycle"""
-    print_header("Running Autonomous Analysis")
+    from workers.manager import get_worker_manager
+    from workers.worker_monitor import get_worker_monitor
+    from core.autonomous import get_autonomous_engine
 
-    engine = get_autonomous_engine()
-    manager = get_worker_manager()
-    monitor = get_worker_monitor()
+    out = Out()
+    try:
+        print_header("Running Autonomous Analysis", out)
 
-    result = engine.run_analysis_cycle(manager, monitor)
+        engine = get_autonomous_engine()
+        manager = get_worker_manager()
+        monitor = get_worker_monitor()
 
-    print(f"Analyzed: {len(result['analyses'])} workers")
-    print(f"Decisions Made: {result['decisions_made']}")
-    print(f"Pending Approvals: {result['pending_approvals']}")
+        result = engine.run_analysis_cycle(manager, monitor)
 
-    if result['decisions']:
-        print_section("Decisions")
-        for decision in result['decisions']:
-            print(f"\n  {decision['type'].upper()}: {decision['target']}")
-            print(f"  Reason: {decision['reason']}")
-            print(f"  Expected ROI: {format_percent(decision['expected_roi'])}")
-            print(f"  Cost Impact: {format_currency(decision['cost_impact'])}")
-            print(f"  Requires Approval: {'YES' if decision['requires_approval'] else 'NO'}")
+        out.p(f"Analyzed: {len(result['analyses'])} workers")
+        out.p(f"Decisions Made: {result['decisions_made']}")
+        out.p(f"Pending Approvals: {result['pending_approvals']}")
 
+        if result['decisions']:
+            print_section("Decisions", out)
+            for decision in result['decisions']:
+                out.p(f"\n  {decision['type'].upper()}: {decision['target']}")
+                out.p(f"  Reason: {decision['reason']}")
+                out.p(f"  Expected ROI: {decision['expected_roi']:.1f}%")
+                out.p(f"  Cost Impact: ${decision['cost_impact']:,.2f}")
+                out.p(f"  Requires Approval: {'YES' if decision['requires_approval'] else 'NO'}")
+    finally:
+        out.flush()
 
-# === MAIN CLI ===
 
-def main():
-    """Main CLI entry point"""
-    parser = argparse.ArgumentParser(
-        description="NovaOS V2 - AI Business Orchestration Platform",
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
+# === COMMAND TABLE ===
 
-    subparsers = parser.add_subparsers(dest='command', help='Commands')
-
-    # System commands
-    subparsers.add_parser('status', help='Show complete system status')
+def _add_costs_args(parser):
+    parser.add_argument('--period', default='today', choices=['today', 'week', 'month'],
+                        help='Time period')
 
-    costs_parser = subparsers.add_parser('costs', help='Show AI cost breakdown')
-    costs_parser.add_argument('--period', default='today', choices=['today', 'week', 'month'],
-                            help='Time period')
 
-    subparsers.add_parser('revenue', help='Show revenue tracking')
+def _add_decide_args(parser):
+    parser.add_argument('question', help='Question or opportunity to evaluate')
 
-    # Board commands
-    subparsers.add_parser('board', help='Show board status')
 
-    decide_parser = subparsers.add_parser('decide', help='Make board decision')
-    decide_parser.add_argument('question', help='Question or opportunity to evaluate')
+def _add_deploy_args(parser):
+    parser.add_argument('department', type=str.lower, choices=KNOWN_DEPARTMENTS, help='Department')
+    parser.add_argument('agent_type', help='Agent type')
+    parser.add_argument('--config', type=_parse_config,
+                        help='Agent configuration (JSON or key=value pairs)')
 
-    # Deployment
-    deploy_parser = subparsers.add_parser('deploy', help='Deploy an agent')
-    deploy_parser.add_argument('department', help='Department (sales, marketing, product, operations, research)')
-    deploy_parser.add_argument('agent_type', help='Agent type')
-    deploy_parser.add_argument('--config', help='Agent configuration (JSON or key=value pairs)')
 
-    # Agent management
-    agents_parser = subparsers.add_parser('agents', help='List agents')
-    agents_parser.add_argument('--status', choices=['active', 'paused', 'killed'], help='Filter by status')
-    agents_parser.add_argument('--department', help='Filter by department')
+def _add_agents_args(parser):
+    parser.add_argument('--status', choices=['active', 'paused', 'killed'], help='Filter by status')
+    parser.add_argument('--department', type=str.lower, choices=KNOWN_DEPARTMENTS,
+                        help='Filter by department')
 
-    agent_parser = subparsers.add_parser('agent', help='Show agent status')
-    agent_parser.add_argument('agent_id', help='Agent ID')
 
-    pause_parser = subparsers.add_parser('pause', help='Pause an agent')
-    pause_parser.add_argument('agent_id', help='Agent ID')
+def _add_agent_id_arg(parser):
+    parser.add_argument('agent_id', help='Agent ID')
 
-    resume_parser = subparsers.add_parser('resume', help='Resume an agent')
-    resume_parser.add_argument('agent_id', help='Agent ID')
 
-    kill_parser = subparsers.add_parser('kill', help='Kill an agent')
-    kill_parser.add_argument('agent_id', help='Agent ID')
+def _add_roi_args(parser):
+    parser.add_argument('target', help='Agent ID or department name')
 
-    # Financial
-    roi_parser = subparsers.add_parser('roi', help='Show ROI for agent or department')
-    roi_parser.add_argument('target', help='Agent ID or department name')
 
-    subparsers.add_parser('optimize', help='Run cost optimization')
+def _add_council_args(parser):
+    parser.add_argument('question', help='Question to analyze')
 
-    # R&D Council
-    council_parser = subparsers.add_parser('council', help='Run R&D Expert Council analysis')
-    council_parser.add_argument('question', help='Question to analyze')
 
-    # Sandbox commands
-    sandbox_parser = subparsers.add_parser('sandbox', help='Sandbox environment')
-    sandbox_subparsers = sandbox_parser.add_subparsers(dest='sandbox_command', help='Sandbox commands')
+def _add_sandbox_commands(parser):
+    sandbox_subparsers = parser.add_subparsers(dest='sandbox_command', help='Sandbox commands')
 
     sandbox_subparsers.add_parser('status', help='Show sandbox status')
 
@@ -1094,7 +1320,8 @@ def main():
     sandbox_deploy_parser.add_argument('project_id', help='Project ID')
     sandbox_deploy_parser.add_argument('agent_type', help='Agent type')
     sandbox_deploy_parser.add_argument('--name', help='Agent name')
-    sandbox_deploy_parser.add_argument('--config', help='Agent configuration')
+    sandbox_deploy_parser.add_argument('--config', type=_parse_config,
+                                       help='Agent configuration')
 
     sandbox_eval_parser = sandbox_subparsers.add_parser('eval', help='Evaluate project')
     sandbox_eval_parser.add_argument('project_id', help='Project ID')
@@ -1108,17 +1335,19 @@ def main():
     sandbox_kill_parser.add_argument('project_id', help='Project ID')
     sandbox_kill_parser.add_argument('--delete', action='store_true', help='Delete workspace directory')
 
-    # Dashboard commands
-    dashboard_parser = subparsers.add_parser('dashboard', help='Visual dashboard')
-    dashboard_subparsers = dashboard_parser.add_subparsers(dest='dashboard_command', help='Dashboard commands')
 
-    dashboard_subparsers.add_parser('start', help='Start dashboard server')
+def _add_dashboard_commands(parser):
+    dashboard_subparsers = parser.add_subparsers(dest='dashboard_command', help='Dashboard commands')
+
+    dashboard_start_parser = dashboard_subparsers.add_parser('start', help='Start dashboard server')
+    dashboard_start_parser.add_argument('--detach', action='store_true',
+                                        help='Run the server in the background and return')
     dashboard_subparsers.add_parser('stop', help='Stop dashboard server')
     dashboard_subparsers.add_parser('status', help='Check dashboard status')
 
-    # Worker commands
-    workers_parser = subparsers.add_parser('workers', help='Background worker management')
-    workers_subparsers = workers_parser.add_subparsers(dest='workers_command', help='Worker commands')
+
+def _add_workers_commands(parser):
+    workers_subparsers = parser.add_subparsers(dest='workers_command', help='Worker commands')
 
     workers_subparsers.add_parser('start', help='Start all workers')
     workers_subparsers.add_parser('stop', help='Stop all workers')
@@ -1129,127 +1358,248 @@ def main():
     workers_scale_parser.add_argument('worker_id', help='Worker ID')
     workers_scale_parser.add_argument('--multiplier', type=int, default=2, help='Scale multiplier')
 
-    # Autonomous commands
-    autonomous_parser = subparsers.add_parser('autonomous', help='Autonomous decision engine')
-    autonomous_subparsers = autonomous_parser.add_subparsers(dest='autonomous_command', help='Autonomous commands')
+
+def _add_autonomous_commands(parser):
+    autonomous_subparsers = parser.add_subparsers(dest='autonomous_command', help='Autonomous commands')
 
     autonomous_subparsers.add_parser('enable', help='Enable autonomous mode')
     autonomous_subparsers.add_parser('disable', help='Disable autonomous mode')
     autonomous_subparsers.add_parser('status', help='Show autonomous status')
     autonomous_subparsers.add_parser('run', help='Run analysis cycle')
 
-    # Learning commands (from cli_extensions)
-    from cli_extensions import register_learning_commands
-    learning_handlers = register_learning_commands(subparsers)
 
-    args = parser.parse_args()
+# name -> (help, handler, argument builder or None)
+COMMANDS = {
+    'status': ('Show complete system status', cmd_status, None),
+    'costs': ('Show AI cost breakdown', cmd_costs, _add_costs_args),
+    'revenue': ('Show revenue tracking', cmd_revenue, None),
+    'board': ('Show board status', cmd_board_status, None),
+    'decide': ('Make board decision', cmd_board_decide, _add_decide_args),
+    'deploy': ('Deploy an agent', cmd_deploy, _add_deploy_args),
+    'agents': ('List agents', cmd_agents_list, _add_agents_args),
+    'agent': ('Show agent status', cmd_agent_status, _add_agent_id_arg),
+    'pause': ('Pause an agent', cmd_agent_pause, _add_agent_id_arg),
+    'resume': ('Resume an agent', cmd_agent_resume, _add_agent_id_arg),
+    'kill': ('Kill an agent', cmd_agent_kill, _add_agent_id_arg),
+    'roi': ('Show ROI for agent or department', cmd_roi, _add_roi_args),
+    'optimize': ('Run cost optimization', cmd_optimize, None),
+    'council': ('Run R&D Expert Council analysis', cmd_council, _add_council_args),
+}
+
+# Subcommand handlers per command group
+_SANDBOX_HANDLERS = {
+    'status': cmd_sandbox_status,
+    'create': cmd_sandbox_create,
+    'list': cmd_sandbox_list,
+    'project': cmd_sandbox_project,
+    'deploy': cmd_sandbox_deploy,
+    'eval': cmd_sandbox_eval,
+    'promote': cmd_sandbox_promote,
+    'kill': cmd_sandbox_kill,
+}
+
+_DASHBOARD_HANDLERS = {
+    'start': cmd_dashboard_start,
+    'stop': cmd_dashboard_stop,
+    'status': cmd_dashboard_status,
+}
+
+_WORKERS_HANDLERS = {
+    'start': cmd_workers_start,
+    'stop': cmd_workers_stop,
+    'status': cmd_workers_status,
+    'scale': cmd_workers_scale,
+    'health': cmd_workers_health,
+}
+
+_AUTONOMOUS_HANDLERS = {
+    'enable': cmd_autonomous_enable,
+    'disable': cmd_autonomous_disable,
+    'status': cmd_autonomous_status,
+    'run': cmd_autonomous_run,
+}
+
+# name -> (help, nested subcommand builder, subcommand handlers);
+# the chosen subcommand is stored on args as `<name>_command`
+GROUPS = {
+    'sandbox': ('Sandbox environment', _add_sandbox_commands, _SANDBOX_HANDLERS),
+    'dashboard': ('Visual dashboard', _add_dashboard_commands, _DASHBOARD_HANDLERS),
+    'workers': ('Background worker management', _add_workers_commands, _WORKERS_HANDLERS),
+    'autonomous': ('Autonomous decision engine', _add_autonomous_commands, _AUTONOMOUS_HANDLERS),
+}
+
+
+# Argument-free invocations that can skip argparse: argv tail -> (handler, parsed args)
+_FAST_PATHS = {
+    (name,): (handler, {'command': name})
+    for name, (_, handler, add_args) in COMMANDS.items()
+    if add_args is None
+}
+_FAST_PATHS.update({
+    (group, sub): (GROUPS[group][2][sub], {'command': group, f'{group}_command': sub})
+    for group, subs in (
+        ('sandbox', ('status', 'list')),
+        ('dashboard', ('stop', 'status')),
+        ('workers', ('start', 'stop', 'status', 'health')),
+        ('autonomous', ('enable', 'disable', 'status', 'run')),
+    )
+    for sub in subs
+})
+
+# Single-positional invocations (`nova agent <id>`): argv head -> (handler, parsed args, dest)
+_POSITIONAL_FAST_PATHS = {
+    (name,): (COMMANDS[name][1], {'command': name}, dest)
+    for name, dest in (
+        ('decide', 'question'),
+        ('agent', 'agent_id'),
+        ('pause', 'agent_id'),
+        ('resume', 'agent_id'),
+        ('kill', 'agent_id'),
+        ('roi', 'target'),
+        ('council', 'question'),
+    )
+}
+_POSITIONAL_FAST_PATHS.update({
+    ('sandbox', sub): (_SANDBOX_HANDLERS[sub], {'command': 'sandbox', 'sandbox_command': sub}, 'project_id')
+    for sub in ('project', 'promote')
+})
 
-    if not args.command:
-        parser.print_help()
-        return
 
-    # Handle sandbox subcommands
-    if args.command == 'sandbox':
-        if not args.sandbox_command:
-            sandbox_parser.print_help()
-            return
+def _match_fast_path(argv):
+    """Resolve argv to (handler, Namespace) without argparse, or None"""
+    fast_path = _FAST_PATHS.get(argv)
+    if fast_path:
+        handler, parsed = fast_path
+        return handler, argparse.Namespace(**parsed)
 
-        sandbox_handlers = {
-            'status': cmd_sandbox_status,
-            'create': cmd_sandbox_create,
-            'list': cmd_sandbox_list,
-            'project': cmd_sandbox_project,
-            'deploy': cmd_sandbox_deploy,
-            'eval': cmd_sandbox_eval,
-            'promote': cmd_sandbox_promote,
-            'kill': cmd_sandbox_kill
-        }
-
-        handler = sandbox_handlers.get(args.sandbox_command)
-        if handler:
-            try:
-                handler(args)
-            except Exception as e:
-                print(f"\nError: {e}")
-                import traceback
-                traceback.print_exc()
-        else:
-            sandbox_parser.print_help()
-        return
+    # Anything that looks like an option (-h, --config, ...) goes to argparse
+    if argv and not argv[-1].startswith('-'):
+        fast_path = _POSITIONAL_FAST_PATHS.get(argv[:-1])
+        if fast_path:
+            handler, parsed, dest = fast_path
+            return handler, argparse.Namespace(**parsed, **{dest: argv[-1]})
 
-    # Handle dashboard subcommands
-    if args.command == 'dashboard':
-        if not args.dashboard_command:
-            dashboard_parser.print_help()
-            return
+    return None
 
-        dashboard_handlers = {
-            'start': cmd_dashboard_start,
-            'stop': cmd_dashboard_stop,
-            'status': cmd_dashboard_status
-        }
 
-        handler = dashboard_handlers.get(args.dashboard_command)
-        if handler:
-            try:
-                handler(args)
-            except Exception as e:
-                print(f"\nError: {e}")
-                import traceback
-                traceback.print_exc()
-        else:
-            dashboard_parser.print_help()
-        return
+# === MAIN CLI ===
 
-    # Handle worker subcommands
-    if args.command == 'workers':
-        if not args.workers_command:
-            workers_parser.print_help()
-            return
+def _build_parser(requested=None):
+    """Build the CLI parser, registering arguments only for the requested command
 
-        workers_handlers = {
-            'start': cmd_workers_start,
-            'stop': cmd_workers_stop,
-            'status': cmd_workers_status,
-            'scale': cmd_workers_scale,
-            'health': cmd_workers_health
-        }
+    Returns (parser, group_parsers, learning_handlers).
+    """
+    parser = argparse.ArgumentParser(
+        description="NovaOS V2 - AI Business Orchestration Platform",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
 
-        handler = workers_handlers.get(args.workers_command)
-        if handler:
-            try:
-                handler(args)
-            except Exception as e:
-                print(f"\nError: {e}")
-                import traceback
-                traceback.print_exc()
-        else:
-            workers_parser.print_help()
+    subparsers = parser.add_subparsers(dest='command', help='Commands')
+
+    # Top-level commands: only the invoked one gets its arguments registered
+    for name, (help_text, _, add_args) in COMMANDS.items():
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if add_args and name == requested:
+            add_args(command_parser)
+
+    # Command groups: nested subcommands are only built for the invoked group
+    group_parsers = {}
+    for name, (help_text, add_commands, _) in GROUPS.items():
+        group_parsers[name] = subparsers.add_parser(name, help=help_text)
+        if name == requested:
+            add_commands(group_parsers[name])
+
+    # Learning commands (from cli_extensions), only imported for `nova learn`
+    learning_handlers = {}
+    if requested == 'learn':
+        from cli_extensions import register_learning_commands
+        learning_handlers = register_learning_commands(
+            subparsers, sys.argv[2] if len(sys.argv) > 2 else None
+        )
+    else:
+        subparsers.add_parser('learn', help='Learning system commands')
+
+    return parser, group_parsers, learning_handlers
+
+
+_top_level_help = None
+
+# Rendered top-level help, reused across invocations
+_HELP_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'novaos', 'help.txt')
+
+
+def _help_cache_key() -> str:
+    """Everything the rendered help depends on: this file, prog name, wrap width"""
+    try:
+        columns = int(os.environ['COLUMNS'])
+    except (KeyError, ValueError):
+        try:
+            columns = os.get_terminal_size(sys.__stdout__.fileno()).columns
+        except (AttributeError, ValueError, OSError):
+            columns = 80
+    return f"{os.stat(__file__).st_mtime_ns} {os.path.basename(sys.argv[0])} {columns}\n"
+
+
+def get_top_level_help() -> str:
+    """Top-level help text, read from the on-disk cache or rendered from the stub-only parser"""
+    global _top_level_help
+    if _top_level_help is not None:
+        return _top_level_help
+
+    key = _help_cache_key()
+    try:
+        with open(_HELP_CACHE_PATH, encoding='utf-8') as f:
+            cached = f.read()
+        if cached.startswith(key):
+            _top_level_help = cached[len(key):]
+            return _top_level_help
+    except OSError:
+        pass
+
+    _top_level_help = _build_parser()[0].format_help()
+    try:
+        os.makedirs(os.path.dirname(_HELP_CACHE_PATH), exist_ok=True)
+        with open(_HELP_CACHE_PATH, 'w', encoding='utf-8') as f:
+            f.write(key + _top_level_help)
+    except OSError:
+        pass
+    return _top_level_help
+
+
+def _run():
+    """Parse the command line and dispatch to the chosen handler"""
+    # Status glyphs (✓ ▶ ⏸ ⨯) are UTF-8 regardless of the console's locale
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(encoding='utf-8')
+
+    # e.g. `nova status`, `nova workers health`, `nova agent <id>`: no parser needed
+    fast_path = _match_fast_path(tuple(sys.argv[1:]))
+    if fast_path:
+        _dispatch(*fast_path)
         return
 
-    # Handle autonomous subcommands
-    if args.command == 'autonomous':
-        if not args.autonomous_command:
-            autonomous_parser.print_help()
-            return
+    # `nova` / `nova --help`: only the top-level help is needed
+    if sys.argv[1:] in ([], ['-h'], ['--help']):
+        sys.stdout.write(get_top_level_help())
+        return
 
-        autonomous_handlers = {
-            'enable': cmd_autonomous_enable,
-            'disable': cmd_autonomous_disable,
-            'status': cmd_autonomous_status,
-            'run': cmd_autonomous_run
-        }
+    requested = sys.argv[1]
+    parser, group_parsers, learning_handlers = _build_parser(requested)
+
+    args = parser.parse_args()
 
-        handler = autonomous_handlers.get(args.autonomous_command)
+    if not args.command:
+        parser.print_help()
+        return
+
+    # Command groups: run the chosen subcommand, or show the group's help
+    group = GROUPS.get(args.command)
+    if group:
+        handler = group[2].get(getattr(args, f'{args.command}_command', None))
         if handler:
-            try:
-                handler(args)
-            except Exception as e:
-                print(f"\nError: {e}")
-                import traceback
-                traceback.print_exc()
+            _dispatch(handler, args)
         else:
-            autonomous_parser.print_help()
+            group_parsers[args.command].print_help()
         return
 
     # Handle learning subcommands
@@ -1265,54 +1615,29 @@ def main():
 
         handler = learning_handlers.get(args.learn_command)
         if handler:
-            try:
-                handler(args)
-            except Exception as e:
-                print(f"\nError: {e}")
-                import traceback
-                traceback.print_exc()
+            _dispatch(handler, args)
         return
 
     # Route to command handler
-    handlers = {
-        'status': cmd_status,
-        'costs': cmd_costs,
-        'revenue': cmd_revenue,
-        'board': cmd_board_status,
-        'decide': cmd_board_decide,
-        'deploy': cmd_deploy,
-        'agents': cmd_agents_list,
-        'agent': cmd_agent_status,
-        'pause': cmd_agent_pause,
-        'resume': cmd_agent_resume,
-        'kill': cmd_agent_kill,
-        'roi': cmd_roi,
-        'optimize': cmd_optimize,
-        'council': cmd_council
-    }
-
-    handler = handlers.get(args.command)
+    command = COMMANDS.get(args.command)
+    handler = command[1] if command else None
     if handler:
-        try:
-            handler(args)
-        except Exception as e:
-            print(f"\nError: {e}")
-            import traceback
-
-
-def safe_datetime_now():
-    """Get current datetime with fallback for timestamp overflow"""
-    try:
-        return datetime.now()
-    except (OSError, OverflowError, ValueError):
-        from datetime import datetime as dt
-        return dt(2025, 1, 1, 0, 0, 0)
-
-            traceback.print_exc()
+        _dispatch(handler, args)
     else:
         print(f"Unknown command: {args.command}")
         parser.print_help()
 
 
+def main():
+    """Main CLI entry point"""
+    try:
+        _run()
+    except Exception as e:
+        command = sys.argv[1] if len(sys.argv) > 1 else 'nova'
+        print(f"\nError in '{command}': {e}")
+        traceback.print_exc()
+        sys.exit(1)
+
+
 if __name__ == '__main__':
     main()
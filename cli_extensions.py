@@ -3,19 +3,87 @@ NovaOS V2 CLI Extensions
 Additional commands for Learning, Dashboard, Sandbox, and DDS
 """
 
+import os
 import sys
+import json
 import argparse
 from typing import Dict, Any
 
 
+# One hit in `nova learn query`
+_SIMILAR_ROW = (
+    "{index}. [{timestamp}] {agent} - {decision_type}\n"
+    "   Cost: ${cost:.2f} | Tokens: {tokens_used}\n"
+    "   Has Outcome: {has_outcome}\n"
+    "   Relevance: {relevance:.1%}\n"
+)
+
+# `nova learn analyze` report; the {by_type}, {*_performers} and
+# {recommendations} blocks are pre-rendered (possibly empty) strings
+_ANALYSIS_TEMPLATE = (
+    "\n📊 Weekly Learning Analysis\n\n"
+    "Period: {period}\n"
+    "Timestamp: {timestamp}\n"
+    "\n=== DECISIONS ===\n"
+    "Total Decisions: {total_decisions}\n"
+    "Total Cost: ${total_cost:.2f}\n"
+    "Avg Tokens per Decision: {avg_tokens}{by_type}\n"
+    "\n=== AGENTS ===\n"
+    "Total Active Agents: {total_agents}{top_performers}{low_performers}\n"
+    "\n=== OPPORTUNITIES ===\n"
+    "Total Opportunities: {total_opportunities}\n"
+    "Avg Confidence: {avg_confidence:.1%}\n"
+    "Total Potential Revenue: ${total_potential_revenue:.2f}\n"
+    "\n=== RECOMMENDATIONS ==={recommendations}"
+)
+
+
+# === SHARED INSTANCES ===
+
+# Resolved on first use, so later commands in the same process skip the
+# import and the factory call
+_learning = None
+_sandbox = None
+_dds = None
+
+
+def _get_learning():
+    """Learning system instance"""
+    global _learning
+    if _learning is None:
+        from core.learning import get_learning
+        _learning = get_learning()
+    return _learning
+
+
+def _get_sandbox():
+    """Sandbox manager instance"""
+    global _sandbox
+    if _sandbox is None:
+        from sandbox.manager import get_sandbox
+        _sandbox = get_sandbox()
+    return _sandbox
+
+
+def _get_dds():
+    """DDS integration instance"""
+    global _dds
+    if _dds is None:
+        from integrations.dds import get_dds
+        _dds = get_dds()
+    return _dds
+
+
+def _print_json(data):
+    """Write a handler's result as compact JSON (for --json)"""
+    sys.stdout.write(json.dumps(data, separators=(',', ':'), default=str) + "\n")
+
+
 # === LEARNING COMMANDS ===
 
 def cmd_learn_store(args):
     """Store learning outcome"""
-    from core.learning import get_learning
-    import json
-
-    learning = get_learning()
+    learning = _get_learning()
 
     # Parse outcome and metrics if provided
     outcome = args.outcome
@@ -23,7 +91,7 @@ def cmd_learn_store(args):
     if args.metrics:
         try:
             metrics = json.loads(args.metrics)
-        except:
+        except json.JSONDecodeError:
             print(f"Warning: Could not parse metrics JSON")
 
     # Store decision with outcome
@@ -43,9 +111,7 @@ def cmd_learn_store(args):
 
 def cmd_learn_query(args):
     """Query similar situations"""
-    from core.learning import get_learning
-
-    learning = get_learning()
+    learning = _get_learning()
     results = learning.query_similar(
         query_text=args.query,
         collection_type="decisions",
@@ -58,125 +124,151 @@ def cmd_learn_query(args):
         print("No similar situations found.")
         return
 
-    for i, result in enumerate(results, 1):
-        meta = result['metadata']
-        print(f"{i}. [{meta.get('timestamp', 'N/A')}] {meta.get('agent', 'Unknown')} - {meta.get('decision_type', 'N/A')}")
-        print(f"   Cost: ${meta.get('cost', 0):.2f} | Tokens: {meta.get('tokens_used', 0)}")
-        print(f"   Has Outcome: {meta.get('has_outcome', 'unknown')}")
-        print(f"   Relevance: {result.get('relevance', 0):.1%}\n")
+    lines = []
+    try:
+        for i, result in enumerate(results, 1):
+            meta = result['metadata']
+            lines.append(_SIMILAR_ROW.format(
+                index=i,
+                timestamp=meta.get('timestamp', 'N/A'),
+                agent=meta.get('agent', 'Unknown'),
+                decision_type=meta.get('decision_type', 'N/A'),
+                cost=meta.get('cost', 0),
+                tokens_used=meta.get('tokens_used', 0),
+                has_outcome=meta.get('has_outcome', 'unknown'),
+                relevance=result.get('relevance', 0)
+            ))
+    finally:
+        print("\n".join(lines))
+
+
+def _performer_block(title, agents):
+    """Optional '<title>:' block listing up to three agents by ROI"""
+    if not agents:
+        return ""
+    return f"\n\n{title}:" + "".join(
+        f"\n  • {agent['name']} ({agent['department']}): {agent['roi']:.1f}% ROI"
+        for agent in agents[:3]
+    )
 
 
 def cmd_learn_analyze(args):
     """Run weekly analysis"""
-    from core.learning import get_learning
-    import json
-
-    learning = get_learning()
+    learning = _get_learning()
     analysis = learning.analyze_weekly()
 
-    print("\n📊 Weekly Learning Analysis\n")
-    print(f"Period: {analysis['period']}")
-    print(f"Timestamp: {analysis['timestamp']}")
+    if getattr(args, 'json', False):
+        _print_json(analysis)
+        return
 
-    # Decisions
-    print("\n=== DECISIONS ===")
     decisions = analysis['decisions']
-    print(f"Total Decisions: {decisions['total_decisions']}")
-    print(f"Total Cost: ${decisions['total_cost']:.2f}")
-    print(f"Avg Tokens per Decision: {decisions['avg_tokens_per_decision']}")
-    if decisions['by_type']:
-        print("\nBy Type:")
-        for dtype, data in decisions['by_type'].items():
-            print(f"  {dtype}: {data['count']} decisions, ${data['total_cost']:.2f}")
-
-    # Agents
-    print("\n=== AGENTS ===")
     agents = analysis['agents']
-    print(f"Total Active Agents: {agents['total_agents']}")
-    if agents['high_performers']:
-        print("\nTop Performers:")
-        for agent in agents['high_performers'][:3]:
-            print(f"  • {agent['name']} ({agent['department']}): {agent['roi']:.1f}% ROI")
-    if agents['low_performers']:
-        print("\nLow Performers:")
-        for agent in agents['low_performers'][:3]:
-            print(f"  • {agent['name']} ({agent['department']}): {agent['roi']:.1f}% ROI")
-
-    # Opportunities
-    print("\n=== OPPORTUNITIES ===")
     opps = analysis['opportunities']
-    print(f"Total Opportunities: {opps['total_opportunities']}")
-    print(f"Avg Confidence: {opps['avg_confidence']:.1%}")
-    print(f"Total Potential Revenue: ${opps['total_potential_revenue']:.2f}")
 
-    # Recommendations
-    print("\n=== RECOMMENDATIONS ===")
-    for item in analysis['recommendations']:
-        print(f"→ {item}")
+    by_type = ""
+    if decisions['by_type']:
+        by_type = "\n\nBy Type:" + "".join(
+            f"\n  {dtype}: {data['count']} decisions, ${data['total_cost']:.2f}"
+            for dtype, data in decisions['by_type'].items()
+        )
+
+    print(_ANALYSIS_TEMPLATE.format(
+        period=analysis['period'],
+        timestamp=analysis['timestamp'],
+        total_decisions=decisions['total_decisions'],
+        total_cost=decisions['total_cost'],
+        avg_tokens=decisions['avg_tokens_per_decision'],
+        by_type=by_type,
+        total_agents=agents['total_agents'],
+        top_performers=_performer_block("Top Performers", agents['high_performers']),
+        low_performers=_performer_block("Low Performers", agents['low_performers']),
+        total_opportunities=opps['total_opportunities'],
+        avg_confidence=opps['avg_confidence'],
+        total_potential_revenue=opps['total_potential_revenue'],
+        recommendations="".join(f"\n→ {item}" for item in analysis['recommendations'])
+    ))
 
 
 def cmd_learn_patterns(args):
     """Identify patterns"""
-    from core.learning import get_learning
-
-    learning = get_learning()
+    learning = _get_learning()
     pattern_type = args.type if hasattr(args, 'type') else 'all'
     patterns = learning.get_patterns(pattern_type=pattern_type)
 
-    print(f"\n🎯 Identified Patterns ({patterns['pattern_type']})\n")
-
-    # Decision patterns
-    if 'decision_patterns' in patterns:
-        print("=== DECISION PATTERNS ===")
-        dec_patterns = patterns['decision_patterns']
-
-        if dec_patterns.get('most_common_types'):
-            print("\nMost Common Decision Types:")
-            for item in dec_patterns['most_common_types']:
-                print(f"  • {item['type']}: {item['count']} times")
-
-        if dec_patterns.get('cost_by_type'):
-            print("\nCost by Decision Type:")
-            for item in dec_patterns['cost_by_type']:
-                print(f"  • {item['type']}: ${item['avg_cost']:.2f} avg ({item['count']} decisions)")
-
-    # Agent patterns
-    if 'agent_patterns' in patterns:
-        print("\n=== AGENT PATTERNS ===")
-        agent_patterns = patterns['agent_patterns']
-
-        if agent_patterns.get('roi_by_department'):
-            print("\nROI by Department:")
-            for dept in agent_patterns['roi_by_department']:
-                print(f"  • {dept['department']}: {dept['avg_roi']:.1f}% avg ROI ({dept['agent_count']} agents)")
-
-        if agent_patterns.get('efficiency_by_type'):
-            print("\nEfficiency by Agent Type:")
-            for item in agent_patterns['efficiency_by_type']:
-                print(f"  • {item['type']}: ${item['avg_revenue']:.2f} revenue, ${item['avg_cost']:.2f} cost ({item['count']} agents)")
-
-    # Opportunity patterns
-    if 'opportunity_patterns' in patterns:
-        print("\n=== OPPORTUNITY PATTERNS ===")
-        opp_patterns = patterns['opportunity_patterns']
-
-        if opp_patterns.get('by_source'):
-            print("\nBy Source:")
-            for item in opp_patterns['by_source']:
-                print(f"  • {item['source']}: {item['total']} total, {item['pursuit_rate']:.1f}% pursued")
+    if getattr(args, 'json', False):
+        _print_json(patterns)
+        return
 
-        if opp_patterns.get('revenue_by_status'):
-            print("\nRevenue by Status:")
-            for item in opp_patterns['revenue_by_status']:
-                print(f"  • {item['status']}: ${item['avg_revenue']:.2f} avg ({item['count']} opportunities)")
+    lines = []
+    write = lines.append
+    try:
+        write(f"\n🎯 Identified Patterns ({patterns['pattern_type']})\n")
+
+        # Decision patterns
+        if 'decision_patterns' in patterns:
+            write("=== DECISION PATTERNS ===")
+            dec_patterns = patterns['decision_patterns']
+
+            if dec_patterns.get('most_common_types'):
+                write("\nMost Common Decision Types:")
+                lines.extend(
+                    f"  • {item['type']}: {item['count']} times"
+                    for item in dec_patterns['most_common_types']
+                )
+
+            if dec_patterns.get('cost_by_type'):
+                write("\nCost by Decision Type:")
+                lines.extend(
+                    f"  • {item['type']}: ${item['avg_cost']:.2f} avg ({item['count']} decisions)"
+                    for item in dec_patterns['cost_by_type']
+                )
+
+        # Agent patterns
+        if 'agent_patterns' in patterns:
+            write("\n=== AGENT PATTERNS ===")
+            agent_patterns = patterns['agent_patterns']
+
+            if agent_patterns.get('roi_by_department'):
+                write("\nROI by Department:")
+                lines.extend(
+                    f"  • {dept['department']}: {dept['avg_roi']:.1f}% avg ROI ({dept['agent_count']} agents)"
+                    for dept in agent_patterns['roi_by_department']
+                )
+
+            if agent_patterns.get('efficiency_by_type'):
+                write("\nEfficiency by Agent Type:")
+                lines.extend(
+                    f"  • {item['type']}: ${item['avg_revenue']:.2f} revenue, ${item['avg_cost']:.2f} cost ({item['count']} agents)"
+                    for item in agent_patterns['efficiency_by_type']
+                )
+
+        # Opportunity patterns
+        if 'opportunity_patterns' in patterns:
+            write("\n=== OPPORTUNITY PATTERNS ===")
+            opp_patterns = patterns['opportunity_patterns']
+
+            if opp_patterns.get('by_source'):
+                write("\nBy Source:")
+                lines.extend(
+                    f"  • {item['source']}: {item['total']} total, {item['pursuit_rate']:.1f}% pursued"
+                    for item in opp_patterns['by_source']
+                )
+
+            if opp_patterns.get('revenue_by_status'):
+                write("\nRevenue by Status:")
+                lines.extend(
+                    f"  • {item['status']}: ${item['avg_revenue']:.2f} avg ({item['count']} opportunities)"
+                    for item in opp_patterns['revenue_by_status']
+                )
+    finally:
+        print("\n".join(lines))
 
 
 # === DASHBOARD COMMANDS ===
 
 def cmd_dashboard_start(args):
     """Start dashboard server"""
-    import subprocess
-    import os
+    from config.settings import DATA_DIR
 
     dashboard_path = "/Users/krissanders/novaos-v2/dashboard"
 
@@ -184,31 +276,49 @@ def cmd_dashboard_start(args):
     print(f"   URL: http://localhost:{args.port or 5000}")
     print("\n   Press Ctrl+C to stop\n")
 
+    # Record the server PID so `dashboard stop` can signal it directly;
+    # exec keeps this process's PID
+    pid_file = DATA_DIR / "dashboard.pid"
+    pid_file.parent.mkdir(parents=True, exist_ok=True)
+    pid_file.write_text(str(os.getpid()))
+
+    # Replace the CLI process with the dashboard server
+    sys.stdout.flush()
+    # exec skips atexit, so write out queued/buffered log records now
+    from core.logging_setup import shutdown_logging
+    shutdown_logging()
     os.chdir(dashboard_path)
-    subprocess.run([sys.executable, "app.py", "--port", str(args.port or 5000)])
+    os.execv(sys.executable, [sys.executable, "app.py", "--port", str(args.port or 5000)])
 
 
 def cmd_dashboard_stop(args):
     """Stop dashboard server"""
-    import subprocess
+    import psutil
+    from config.settings import DATA_DIR
 
     print("⏹ Stopping NovaOS Dashboard...")
 
-    # Find and kill Flask process
+    # Signal the PID recorded by `dashboard start`. Nothing removes the file
+    # when the server exits, so confirm the PID still runs app.py before
+    # signalling it - it may have been reused by an unrelated process.
+    pid_file = DATA_DIR / "dashboard.pid"
     try:
-        subprocess.run(["pkill", "-f", "flask"])
+        proc = psutil.Process(int(pid_file.read_text()))
+        if "app.py" not in proc.cmdline():
+            raise psutil.NoSuchProcess(proc.pid)
+        proc.terminate()
         print("✓ Dashboard stopped")
-    except:
+    except (OSError, ValueError, psutil.Error):
+        # No/unreadable PID file, garbage contents, or a stale/reused PID
         print("No dashboard process found")
+    pid_file.unlink(missing_ok=True)
 
 
 # === SANDBOX COMMANDS ===
 
 def cmd_sandbox_create(args):
     """Create sandbox project"""
-    from sandbox.manager import get_sandbox
-
-    sandbox = get_sandbox()
+    sandbox = _get_sandbox()
     project_id = sandbox.create_project(args.name, args.description or "")
 
     print(f"✓ Sandbox project created: {args.name}")
@@ -218,16 +328,13 @@ def cmd_sandbox_create(args):
 
 def cmd_sandbox_deploy(args):
     """Deploy agent in sandbox"""
-    from sandbox.manager import get_sandbox
+    sandbox = _get_sandbox()
 
-    sandbox = get_sandbox()
-
-    import json
     config = {}
     if args.config:
         try:
             config = json.loads(args.config)
-        except:
+        except json.JSONDecodeError:
             for pair in args.config.split(','):
                 if '=' in pair:
                     key, value = pair.split('=', 1)
@@ -246,9 +353,7 @@ def cmd_sandbox_deploy(args):
 
 def cmd_sandbox_list(args):
     """List sandbox projects"""
-    from sandbox.manager import get_sandbox
-
-    sandbox = get_sandbox()
+    sandbox = _get_sandbox()
     projects = sandbox.list_projects()
 
     print("\n🧪 Sandbox Projects\n")
@@ -267,9 +372,7 @@ def cmd_sandbox_list(args):
 
 def cmd_sandbox_evaluate(args):
     """Evaluate sandbox project"""
-    from sandbox.manager import get_sandbox
-
-    sandbox = get_sandbox()
+    sandbox = _get_sandbox()
     evaluation = sandbox.evaluate_project(args.project)
 
     print(f"\n📋 Sandbox Project Evaluation: {args.project}\n")
@@ -284,9 +387,7 @@ def cmd_sandbox_evaluate(args):
 
 def cmd_sandbox_promote(args):
     """Promote sandbox project to production"""
-    from sandbox.manager import get_sandbox
-
-    sandbox = get_sandbox()
+    sandbox = _get_sandbox()
     result = sandbox.promote_project(args.project)
 
     print(f"✓ Project promoted to production: {args.project}")
@@ -296,9 +397,7 @@ def cmd_sandbox_promote(args):
 
 def cmd_sandbox_kill(args):
     """Kill sandbox project"""
-    from sandbox.manager import get_sandbox
-
-    sandbox = get_sandbox()
+    sandbox = _get_sandbox()
     sandbox.kill_project(args.project)
 
     print(f"⨯ Sandbox project deleted: {args.project}")
@@ -308,9 +407,7 @@ def cmd_sandbox_kill(args):
 
 def cmd_dds_deploy(args):
     """Deploy DDS campaign"""
-    from integrations.dds import get_dds
-
-    dds = get_dds()
+    dds = _get_dds()
 
     config = {
         'vertical': args.vertical,
@@ -335,81 +432,116 @@ def cmd_dds_deploy(args):
 
 def cmd_dds_status(args):
     """Get DDS campaign status"""
-    from integrations.dds import get_dds
-
-    dds = get_dds()
+    dds = _get_dds()
     status = dds.get_dds_status()
 
-    print("\n📊 DDS Campaign Status\n")
-    print(f"Total Campaigns: {status['total_campaigns']}")
-    print(f"Active: {status['active_campaigns']}")
-    print(f"Total Cost: ${status['total_cost']:.2f}")
-    print(f"Total Revenue: ${status['total_revenue']:.2f}")
-    print(f"ROI: {status['roi']:.1f}%")
-
-    if status['campaigns']:
-        print("\nCampaigns:")
-        for campaign in status['campaigns']:
-            print(f"  • {campaign['name']}")
-            print(f"    Status: {campaign['status']}")
-            print(f"    Cost: ${campaign['cost']:.2f} | Revenue: ${campaign['revenue']:.2f} | ROI: {campaign['roi']:.1f}%")
+    lines = []
+    write = lines.append
+    try:
+        write("\n📊 DDS Campaign Status\n")
+        write(f"Total Campaigns: {status['total_campaigns']}")
+        write(f"Active: {status['active_campaigns']}")
+        write(f"Total Cost: ${status['total_cost']:.2f}")
+        write(f"Total Revenue: ${status['total_revenue']:.2f}")
+        write(f"ROI: {status['roi']:.1f}%")
+
+        if status['campaigns']:
+            write("\nCampaigns:")
+            lines.extend(
+                f"  • {campaign['name']}\n"
+                f"    Status: {campaign['status']}\n"
+                f"    Cost: ${campaign['cost']:.2f} | Revenue: ${campaign['revenue']:.2f} | ROI: {campaign['roi']:.1f}%"
+                for campaign in status['campaigns']
+            )
+    finally:
+        print("\n".join(lines))
 
 
 def cmd_dds_report(args):
     """Generate DDS report"""
-    from integrations.dds import get_dds
-
-    dds = get_dds()
+    dds = _get_dds()
     report = dds.generate_report(args.campaign_id if hasattr(args, 'campaign_id') else None)
 
-    print("\n📈 DDS Performance Report\n")
-    print(f"Leads Generated: {report['leads_generated']}")
-    print(f"Qualified Leads: {report['qualified_leads']}")
-    print(f"Qualification Rate: {report['qualification_rate']:.1f}%")
-    print(f"Outreach Success Rate: {report['outreach_success_rate']:.1f}%")
-    print(f"Cost per Lead: ${report['cost_per_lead']:.2f}")
-    print(f"Cost per Qualified Lead: ${report['cost_per_qualified_lead']:.2f}")
-    print(f"Revenue Generated: ${report['revenue_generated']:.2f}")
-    print(f"ROI: {report['roi']:.1f}%")
+    if getattr(args, 'json', False):
+        _print_json(report)
+        return
 
-    if report.get('recommendations'):
-        print("\nRecommendations:")
-        for rec in report['recommendations']:
-            print(f"  • {rec}")
+    lines = []
+    write = lines.append
+    try:
+        write("\n📈 DDS Performance Report\n")
+        write(f"Leads Generated: {report['leads_generated']}")
+        write(f"Qualified Leads: {report['qualified_leads']}")
+        write(f"Qualification Rate: {report['qualification_rate']:.1f}%")
+        write(f"Outreach Success Rate: {report['outreach_success_rate']:.1f}%")
+        write(f"Cost per Lead: ${report['cost_per_lead']:.2f}")
+        write(f"Cost per Qualified Lead: ${report['cost_per_qualified_lead']:.2f}")
+        write(f"Revenue Generated: ${report['revenue_generated']:.2f}")
+        write(f"ROI: {report['roi']:.1f}%")
+
+        if report.get('recommendations'):
+            write("\nRecommendations:")
+            lines.extend(
+                f"  • {rec}"
+                for rec in report['recommendations']
+            )
+    finally:
+        print("\n".join(lines))
 
 
 # === COMMAND REGISTRATION ===
 
-def register_learning_commands(subparsers):
-    """Register learning commands"""
-    learn_parser = subparsers.add_parser('learn', help='Learning system commands')
-    learn_subparsers = learn_parser.add_subparsers(dest='learn_command')
+def _add_learn_store_args(parser):
+    parser.add_argument('decision_id', help='Decision ID')
+    parser.add_argument('outcome', help='Outcome description')
+    parser.add_argument('--metrics', help='Metrics as JSON (e.g., {"revenue": 1000, "roi": 5.0})')
 
-    # learn store
-    store_parser = learn_subparsers.add_parser('store', help='Store decision outcome')
-    store_parser.add_argument('decision_id', help='Decision ID')
-    store_parser.add_argument('outcome', help='Outcome description')
-    store_parser.add_argument('--metrics', help='Metrics as JSON (e.g., {"revenue": 1000, "roi": 5.0})')
 
-    # learn query
-    query_parser = learn_subparsers.add_parser('query', help='Query similar situations')
-    query_parser.add_argument('query', help='Query text')
-    query_parser.add_argument('--limit', type=int, default=5, help='Number of results (default: 5)')
+def _add_learn_query_args(parser):
+    parser.add_argument('query', help='Query text')
+    parser.add_argument('--limit', type=int, default=5, help='Number of results (default: 5)')
 
-    # learn analyze
-    learn_subparsers.add_parser('analyze', help='Run weekly analysis')
 
-    # learn patterns
-    patterns_parser = learn_subparsers.add_parser('patterns', help='Identify patterns')
-    patterns_parser.add_argument('--type', choices=['decisions', 'agents', 'opportunities', 'all'],
-                                  default='all', help='Pattern type to show (default: all)')
+# `learn patterns --type` values, in the order shown in usage
+_PATTERN_TYPES = ('decisions', 'agents', 'opportunities', 'all')
 
-    return {
-        'store': cmd_learn_store,
-        'query': cmd_learn_query,
-        'analyze': cmd_learn_analyze,
-        'patterns': cmd_learn_patterns
-    }
+
+def _add_learn_analyze_args(parser):
+    parser.add_argument('--json', action='store_true', help='Print the raw analysis as JSON')
+
+
+def _add_learn_patterns_args(parser):
+    parser.add_argument('--type', choices=_PATTERN_TYPES,
+                        default='all', help='Pattern type to show (default: all)')
+    parser.add_argument('--json', action='store_true', help='Print the raw patterns as JSON')
+
+
+# learn subcommand -> (help, handler, argument builder or None)
+LEARN_COMMANDS = {
+    'store': ('Store decision outcome', cmd_learn_store, _add_learn_store_args),
+    'query': ('Query similar situations', cmd_learn_query, _add_learn_query_args),
+    'analyze': ('Run weekly analysis', cmd_learn_analyze, _add_learn_analyze_args),
+    'patterns': ('Identify patterns', cmd_learn_patterns, _add_learn_patterns_args),
+}
+
+
+def register_learning_commands(subparsers, requested=None):
+    """Register learning commands
+
+    Only the `requested` subcommand gets its arguments registered; the
+    others are added as bare entries so `nova learn -h` still lists them.
+    """
+    learn_parser = subparsers.add_parser('learn', help='Learning system commands')
+    learn_subparsers = learn_parser.add_subparsers(dest='learn_command')
+
+    handlers = {}
+    for name, (help_text, handler, add_args) in LEARN_COMMANDS.items():
+        command_parser = learn_subparsers.add_parser(name, help=help_text)
+        if add_args and name == requested:
+            add_args(command_parser)
+        handlers[name] = handler
+
+    return handlers
 
 
 def register_dashboard_commands(subparsers):
@@ -489,6 +621,7 @@ def register_dds_commands(subparsers):
     # dds report
     report_parser = dds_subparsers.add_parser('report', help='Generate DDS report')
     report_parser.add_argument('--campaign-id', help='Specific campaign ID')
+    report_parser.add_argument('--json', action='store_true', help='Print the raw report as JSON')
 
     return {
         'deploy': cmd_dds_deploy,
@@ -4,6 +4,7 @@ NovaOS V2 Financial Targets
 """
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 
 def safe_datetime_now():
@@ -11,26 +12,34 @@ def safe_datetime_now():
     try:
         return datetime.now()
     except (OSError, OverflowError, ValueError):
-        from datetime import datetime as dt
-        return dt(2025, 1, 1, 0, 0, 0)
+        return datetime(2025, 1, 1, 0, 0, 0)
 
 
 # === REVENUE TARGETS (10X AGGRESSIVE) ===
 
-MONTHLY_TARGETS = {
-    1: 5000,      # Month 1: $5,000
-    2: 8000,      # Month 2: $8,000
-    3: 15000,     # Month 3: $15,000
-    4: 25000,     # Month 4: $25,000
-    5: 35000,     # Month 5: $35,000
-    6: 50000,     # Month 6: $50,000
-    7: 70000,     # Month 7: $70,000
-    8: 90000,     # Month 8: $90,000
-    9: 120000,    # Month 9: $120,000
-    10: 150000,   # Month 10: $150,000
-    11: 175000,   # Month 11: $175,000
-    12: 200000    # Month 12: $200,000
-}
+# Zero-based since this became a tuple: MONTHLY_TARGETS[m] is month m + 1's
+# target, so old dict-style lookups like MONTHLY_TARGETS[1] silently return
+# month 2 (and [12] raises). Use get_monthly_target(month) instead.
+MONTHLY_TARGETS = (
+    5000,      # Month 1: $5,000
+    8000,      # Month 2: $8,000
+    15000,     # Month 3: $15,000
+    25000,     # Month 4: $25,000
+    35000,     # Month 5: $35,000
+    50000,     # Month 6: $50,000
+    70000,     # Month 7: $70,000
+    90000,     # Month 8: $90,000
+    120000,    # Month 9: $120,000
+    150000,    # Month 10: $150,000
+    175000,    # Month 11: $175,000
+    200000,    # Month 12: $200,000
+)
+
+
+def get_monthly_target(month: int) -> int:
+    """Revenue target for month 1-12 (months past the plan stay at $200k)"""
+    return MONTHLY_TARGETS[month - 1] if 1 <= month <= 12 else 200000
+
 
 # Weekly targets (for more granular tracking)
 WEEKLY_TARGETS = {
@@ -41,34 +50,45 @@ WEEKLY_TARGETS = {
 }
 
 # Daily targets (aggressive daily goals)
+@lru_cache(maxsize=128)
 def get_daily_target(month: int) -> float:
     """Calculate daily target for given month"""
-    monthly_target = MONTHLY_TARGETS.get(month, 200000)
+    monthly_target = get_monthly_target(month)
     return monthly_target / 30  # Rough daily average
 
 
 # === AI COST BUDGETS ===
 
 # Maximum AI spend per month (as absolute $ and % of revenue)
-MONTHLY_AI_BUDGET = {
-    1: 250,     # Max $250 in AI costs (5% of $5k target)
-    2: 400,     # Max $400 (5% of $8k target)
-    3: 750,     # Max $750 (5% of $15k target)
-    4: 1250,    # Max $1,250 (5% of $25k target)
-    5: 1750,    # Max $1,750 (5% of $35k target)
-    6: 2500,    # Max $2,500 (5% of $50k target)
-    7: 3500,    # Max $3,500 (5% of $70k target)
-    8: 4500,    # Max $4,500 (5% of $90k target)
-    9: 6000,    # Max $6,000 (5% of $120k target)
-    10: 7500,   # Max $7,500 (5% of $150k target)
-    11: 8750,   # Max $8,750 (5% of $175k target)
-    12: 10000   # Max $10,000 (5% of $200k target)
-}
+# Zero-based since this became a tuple: MONTHLY_AI_BUDGET[m] is month m + 1's
+# budget, so old dict-style lookups like MONTHLY_AI_BUDGET[1] silently return
+# month 2 (and [12] raises). Use get_monthly_ai_budget(month) instead.
+MONTHLY_AI_BUDGET = (
+    250,       # Max $250 in AI costs (5% of $5k target)
+    400,       # Max $400 (5% of $8k target)
+    750,       # Max $750 (5% of $15k target)
+    1250,      # Max $1,250 (5% of $25k target)
+    1750,      # Max $1,750 (5% of $35k target)
+    2500,      # Max $2,500 (5% of $50k target)
+    3500,      # Max $3,500 (5% of $70k target)
+    4500,      # Max $4,500 (5% of $90k target)
+    6000,      # Max $6,000 (5% of $120k target)
+    7500,      # Max $7,500 (5% of $150k target)
+    8750,      # Max $8,750 (5% of $175k target)
+    10000,     # Max $10,000 (5% of $200k target)
+)
+
+
+def get_monthly_ai_budget(month: int) -> int:
+    """AI budget for month 1-12 (months past the plan stay at $10k)"""
+    return MONTHLY_AI_BUDGET[month - 1] if 1 <= month <= 12 else 10000
+
 
 # Daily AI budget
+@lru_cache(maxsize=128)
 def get_daily_ai_budget(month: int) -> float:
     """Calculate daily AI budget for given month"""
-    monthly_budget = MONTHLY_AI_BUDGET.get(month, 10000)
+    monthly_budget = get_monthly_ai_budget(month)
     return monthly_budget / 30
 
 
@@ -154,9 +174,10 @@ DEPARTMENT_REVENUE_MIX = {
 }
 
 
+@lru_cache(maxsize=128)
 def get_department_target(month: int, department: str) -> float:
     """Calculate department revenue target for given month"""
-    monthly_target = MONTHLY_TARGETS.get(month, 200000)
+    monthly_target = get_monthly_target(month)
     dept_mix = DEPARTMENT_REVENUE_MIX.get(department, 0.0)
     return monthly_target * dept_mix
 
@@ -181,21 +202,26 @@ def get_current_month() -> int:
     return safe_datetime_now().month
 
 
-def get_current_target() -> dict:
-    """Get current revenue and cost targets"""
-    month = get_current_month()
+@lru_cache(maxsize=12)
+def _get_target_for(month: int) -> dict:
+    """Revenue and cost targets for a month (cached; callers get a copy)"""
     return {
         "month": month,
-        "revenue_target": MONTHLY_TARGETS.get(month, 200000),
-        "ai_budget": MONTHLY_AI_BUDGET.get(month, 10000),
+        "revenue_target": get_monthly_target(month),
+        "ai_budget": get_monthly_ai_budget(month),
         "daily_revenue_target": get_daily_target(month),
         "daily_ai_budget": get_daily_ai_budget(month)
     }
 
 
+def get_current_target() -> dict:
+    """Get current revenue and cost targets"""
+    return dict(_get_target_for(get_current_month()))
+
+
 def calculate_required_daily_revenue(days_remaining: int, revenue_so_far: float, month: int) -> float:
     """Calculate required daily revenue to hit monthly target"""
-    monthly_target = MONTHLY_TARGETS.get(month, 200000)
+    monthly_target = get_monthly_target(month)
     remaining_revenue = monthly_target - revenue_so_far
 
     if days_remaining <= 0:
@@ -206,8 +232,8 @@ def calculate_required_daily_revenue(days_remaining: int, revenue_so_far: float,
 
 def is_on_track(current_revenue: float, month: int, day_of_month: int) -> dict:
     """Check if revenue is on track for monthly target"""
-    monthly_target = MONTHLY_TARGETS.get(month, 200000)
-    expected_revenue = (monthly_target / 30) * day_of_month
+    monthly_target = get_monthly_target(month)
+    expected_revenue = get_daily_target(month) * day_of_month
 
     percent_of_expected = (current_revenue / expected_revenue * 100) if expected_revenue > 0 else 0
 
@@ -4,6 +4,7 @@ NovaOS V2 Configuration Settings
 
 import os
 from pathlib import Path
+from types import MappingProxyType
 
 # === PATHS ===
 BASE_DIR = Path("/Users/krissanders/novaos-v2")
@@ -20,12 +21,14 @@ DDS_PATH = Path("/Users/krissanders/prospecting_agent")
 # Anthropic API (Claude)
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY")
 
-# Model selection and costs (per million tokens)
-MODELS = {
+# Model selection and costs (per million tokens), read-only
+MODELS = MappingProxyType({
     "opus": {
         "id": "claude-opus-4-5-20251101",
         "input_cost": 15.00,  # $15 per 1M input tokens
         "output_cost": 75.00,  # $75 per 1M output tokens
+        "cache_write_cost": 18.75,  # $18.75 per 1M prompt-cache write tokens
+        "cache_read_cost": 1.50,  # $1.50 per 1M prompt-cache read tokens
         "max_tokens": 200000,
         "use_case": "critical_decisions"
     },
@@ -33,6 +36,8 @@ MODELS = {
         "id": "claude-sonnet-4-5-20250929",
         "input_cost": 3.00,  # $3 per 1M input tokens
         "output_cost": 15.00,  # $15 per 1M output tokens
+        "cache_write_cost": 3.75,  # $3.75 per 1M prompt-cache write tokens
+        "cache_read_cost": 0.30,  # $0.30 per 1M prompt-cache read tokens
         "max_tokens": 200000,
         "use_case": "general_purpose"
     },
@@ -40,10 +45,17 @@ MODELS = {
         "id": "claude-3-5-haiku-20241022",
         "input_cost": 0.80,  # $0.80 per 1M input tokens
         "output_cost": 4.00,  # $4 per 1M output tokens
+        "cache_write_cost": 1.00,  # $1.00 per 1M prompt-cache write tokens
+        "cache_read_cost": 0.08,  # $0.08 per 1M prompt-cache read tokens
         "max_tokens": 200000,
         "use_case": "filtering_and_simple_tasks"
     }
-}
+})
+
+# Flat per-model lookups for per-call cost arithmetic
+MODEL_INPUT_COSTS = MappingProxyType({name: model["input_cost"] for name, model in MODELS.items()})
+MODEL_OUTPUT_COSTS = MappingProxyType({name: model["output_cost"] for name, model in MODELS.items()})
+MODEL_MAX_TOKENS = MappingProxyType({name: model["max_tokens"] for name, model in MODELS.items()})
 
 # Default model for different operations
 DEFAULT_MODELS = {
@@ -88,6 +100,9 @@ MAX_AI_COST_PERCENT = 5.0  # Target: <5%
 # Alert threshold (higher than target)
 ALERT_AI_COST_PERCENT = 10.0  # Alert if >10%
 
+# Message Batches API bills at 50% of the standard per-token rates
+BATCH_API_COST_MULTIPLIER = 0.5
+
 # Auto-optimization triggers
 AUTO_OPTIMIZE_TRIGGERS = {
     "cost_percent_exceeded": ALERT_AI_COST_PERCENT,
@@ -104,8 +119,10 @@ CACHE_SETTINGS = {
         "market_data": 3600,  # 1 hour
         "trend_data": 1800,   # 30 minutes
         "competitor_data": 7200,  # 2 hours
-        "financial_data": 300  # 5 minutes
-    }
+        "financial_data": 300,  # 5 minutes
+        "council_responses": 3600  # 1 hour
+    },
+    "max_entries": 256  # In-process LRU bound for response caches
 }
 
 # === MONITORING ===
@@ -128,7 +145,7 @@ ALERT_CHANNELS = {
 
 # === DEPARTMENT CONFIGURATIONS ===
 
-DEPARTMENT_CONFIGS = {
+DEPARTMENT_CONFIGS = MappingProxyType({
     "sales": {
         "owns": ["DDS prospecting system"],
         "metrics": ["leads_generated", "cost_per_lead", "conversion_rate"],
@@ -154,11 +171,11 @@ DEPARTMENT_CONFIGS = {
         "metrics": ["opportunities_identified", "prediction_accuracy"],
         "auto_deploy": True
     }
-}
+})
 
 # === R&D EXPERT COUNCIL ===
 
-COUNCIL_AVATARS = {
+COUNCIL_AVATARS = MappingProxyType({
     "thiel": {
         "name": "Thiel",
         "perspective": "Contrarian, monopoly thinking, 0-to-1",
@@ -183,7 +200,7 @@ COUNCIL_AVATARS = {
         "key_question": "What could destroy us? How do we benefit from volatility?",
         "focus": "Downside protection, asymmetric bets"
     }
-}
+})
 
 # === LOGGING ===
 
@@ -192,7 +209,9 @@ LOG_SETTINGS = {
     "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     "file": str(LOGS_DIR / "novaos.log"),
     "max_bytes": 10485760,  # 10MB
-    "backup_count": 5
+    "backup_count": 5,
+    "buffer_capacity": 512,  # Records held in memory before a file write
+    "flush_interval_ms": 1000  # Write sooner once the oldest held record is this old
 }
 
 # === MCP INTEGRATION ===
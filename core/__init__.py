@@ -1,7 +1,15 @@
 """NovaOS V2 Core Module"""
 
-from .memory import NovaMemory, get_memory
-from .learning import NovaLearning, get_learning, get_decision_context, weekly_analysis
+# Exports resolve on first access so that importing a single submodule
+# (e.g. core.agent_factory) doesn't load the learning stack's chromadb
+_EXPORTS = {
+    'NovaMemory': 'memory',
+    'get_memory': 'memory',
+    'NovaLearning': 'learning',
+    'get_learning': 'learning',
+    'get_decision_context': 'learning',
+    'weekly_analysis': 'learning'
+}
 
 __all__ = [
     'NovaMemory',
@@ -11,3 +19,10 @@ __all__ = [
     'get_decision_context',
     'weekly_analysis'
 ]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        from importlib import import_module
+        return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
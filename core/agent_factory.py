@@ -3,13 +3,19 @@ NovaOS V2 Agent Factory
 Dynamic agent deployment and management
 """
 
+import copy
 import uuid
+import logging
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import json
 
 from core.memory import get_memory
 from config.settings import (
+    EXECUTION_AGENT_BUDGET, DEFAULT_AGENT_CONFIG,
+    AUTO_OPTIMIZE_TRIGGERS
+)
 
 
 def safe_datetime_now():
@@ -20,9 +26,14 @@ def safe_datetime_now():
         from datetime import datetime as dt
         return dt(2025, 1, 1, 0, 0, 0)
 
-    EXECUTION_AGENT_BUDGET, DEFAULT_AGENT_CONFIG,
-    AUTO_OPTIMIZE_TRIGGERS
-)
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1024)
+def _parse_agent_config(config: str) -> Dict:
+    """Parse a stored agent config, once per distinct JSON string"""
+    return json.loads(config)
 
 
 class AgentFactory:
@@ -61,9 +72,8 @@ class AgentFactory:
         if not success:
             raise Exception(f"Failed to register agent {agent_id}")
 
-        print(f"✓ Deployed {name} ({agent_type}) in {department} department")
-        print(f"  Agent ID: {agent_id}")
-        print(f"  Token Budget: {token_budget}")
+        logger.info("Deployed %s (%s) in %s department [id=%s budget=%s]",
+                    name, agent_type, department, agent_id, token_budget)
 
         return agent_id
 
@@ -72,7 +82,7 @@ class AgentFactory:
         self.memory.update_agent_status(agent_id, "paused")
         agent = self.memory.get_agent(agent_id)
         if agent:
-            print(f"⏸ Paused agent: {agent['name']} ({agent_id})")
+            logger.info("Paused agent: %s (%s)", agent['name'], agent_id)
             return True
         return False
 
@@ -81,7 +91,7 @@ class AgentFactory:
         self.memory.update_agent_status(agent_id, "active")
         agent = self.memory.get_agent(agent_id)
         if agent:
-            print(f"▶ Resumed agent: {agent['name']} ({agent_id})")
+            logger.info("Resumed agent: %s (%s)", agent['name'], agent_id)
             return True
         return False
 
@@ -90,15 +100,14 @@ class AgentFactory:
         self.memory.update_agent_status(agent_id, "killed")
         agent = self.memory.get_agent(agent_id)
         if agent:
-            print(f"⨯ Killed agent: {agent['name']} ({agent_id})")
-            print(f"  Final stats: Cost ${agent.get('total_cost', 0):.2f}, "
-                  f"Revenue ${agent.get('revenue_generated', 0):.2f}, "
-                  f"ROI {agent.get('roi', 0):.1f}%")
+            logger.info("Killed agent: %s (%s) - cost $%.2f, revenue $%.2f, ROI %.1f%%",
+                        agent['name'], agent_id, agent.get('total_cost', 0),
+                        agent.get('revenue_generated', 0), agent.get('roi', 0))
             return True
         return False
 
-    def get_agent_status(self, agent_id: str) -> Optional[Dict]:
-        """Get detailed agent status"""
+    def get_agent_status(self, agent_id: str, include_config: bool = True) -> Optional[Dict]:
+        """Get detailed agent status (include_config=False skips parsing the config JSON)"""
         agent = self.memory.get_agent(agent_id)
 
         if not agent:
@@ -106,7 +115,11 @@ class AgentFactory:
 
         # Calculate performance metrics
         roi = agent.get('roi', 0)
-        profit = agent.get('revenue_generated', 0) - agent.get('total_cost', 0)
+        tokens_used = agent.get('tokens_used', 0)
+        token_budget = agent.get('token_budget', 0)
+        total_cost = agent.get('total_cost', 0)
+        revenue = agent.get('revenue_generated', 0)
+        profit = revenue - total_cost
 
         # Performance rating
         if roi >= 500:
@@ -120,7 +133,7 @@ class AgentFactory:
         else:
             performance = "NEGATIVE"
 
-        return {
+        status = {
             "agent_id": agent['id'],
             "name": agent['name'],
             "type": agent['type'],
@@ -129,17 +142,22 @@ class AgentFactory:
             "deployed_at": agent['deployed_at'],
             "last_active": agent.get('last_active'),
             "metrics": {
-                "tokens_used": agent.get('tokens_used', 0),
-                "token_budget": agent.get('token_budget', 0),
-                "budget_used_percent": (agent.get('tokens_used', 0) / agent.get('token_budget', 1) * 100),
-                "total_cost": agent.get('total_cost', 0),
-                "revenue_generated": agent.get('revenue_generated', 0),
+                "tokens_used": tokens_used,
+                "token_budget": token_budget,
+                "budget_used_percent": tokens_used / agent.get('token_budget', 1) * 100,
+                "total_cost": total_cost,
+                "revenue_generated": revenue,
                 "profit": profit,
                 "roi": roi,
                 "performance": performance
-            },
-            "config": json.loads(agent.get('config', '{}')) if agent.get('config') else {}
+            }
         }
+        if include_config:
+            config = agent.get('config')
+            # Deep copy: configs nest lists (e.g. trend_monitor sources) and
+            # callers must not be able to edit the cached dict
+            status["config"] = copy.deepcopy(_parse_agent_config(config)) if config else {}
+        return status
 
     def list_agents(self, status: str = None, department: str = None) -> List[Dict]:
         """List all agents with optional filters"""
@@ -162,51 +180,46 @@ class AgentFactory:
         actions_taken = []
         cost_saved = 0.0
 
-        # Get all active agents
-        active_agents = self.memory.get_all_agents(status="active")
-
-        for agent in active_agents:
-            agent_id = agent['id']
-            roi = agent.get('roi', 0)
-            cost = agent.get('total_cost', 0)
-
-            # Check if agent should be paused (negative ROI trigger)
-            if roi < -10:  # Less than -10% ROI
-                # Check how long it's been negative
-                # For now, pause immediately if very negative
-                if roi < -50:
-                    self.pause_agent(agent_id)
-                    actions_taken.append({
-                        "agent_id": agent_id,
-                        "agent_name": agent['name'],
-                        "action": "PAUSED",
-                        "reason": f"Very negative ROI: {roi:.1f}%",
-                        "cost_saved": cost * 0.5  # Estimate 50% cost savings
-                    })
-                    cost_saved += cost * 0.5
-
         # Get cost breakdown
-        memory = get_memory()
-        total_revenue = memory.get_total_revenue()
-        total_costs = memory.get_total_costs()
+        total_revenue = self.memory.get_total_revenue()
+        total_costs = self.memory.get_total_costs()
 
-        # Check if AI costs exceed threshold
+        # Check if AI costs exceed threshold; pick reviews before any pausing
+        reviews = []
         if total_revenue > 0:
             cost_percent = (total_costs / total_revenue) * 100
 
             if cost_percent > AUTO_OPTIMIZE_TRIGGERS["cost_percent_exceeded"]:
                 # Find most expensive agents to review
-                expensive = sorted(active_agents, key=lambda x: x.get('total_cost', 0), reverse=True)[:3]
+                expensive = self.memory.get_costliest_agents(status="active", limit=3)
 
                 for agent in expensive:
                     if agent.get('roi', 0) < 200:  # Less than 200% ROI
-                        actions_taken.append({
+                        reviews.append({
                             "agent_id": agent['id'],
                             "agent_name": agent['name'],
                             "action": "REVIEW_RECOMMENDED",
                             "reason": f"High cost ${agent.get('total_cost', 0):.2f}, low ROI {agent.get('roi', 0):.1f}%"
                         })
 
+        # Pause active agents with very negative ROI (filtered in SQL)
+        for agent in self.memory.get_all_agents(status="active", roi_below=-50):
+            agent_id = agent['id']
+            roi = agent.get('roi', 0)
+            cost = agent.get('total_cost', 0)
+
+            self.pause_agent(agent_id)
+            actions_taken.append({
+                "agent_id": agent_id,
+                "agent_name": agent['name'],
+                "action": "PAUSED",
+                "reason": f"Very negative ROI: {roi:.1f}%",
+                "cost_saved": cost * 0.5  # Estimate 50% cost savings
+            })
+            cost_saved += cost * 0.5
+
+        actions_taken.extend(reviews)
+
         return {
             "timestamp": safe_datetime_now().isoformat(),
             "actions_taken": len(actions_taken),
@@ -216,6 +229,10 @@ class AgentFactory:
         }
 
 
+# Sources watched by trend_monitor when the caller doesn't pass any
+_DEFAULT_TREND_SOURCES = ("twitter", "reddit", "news")
+
+
 class AgentTemplates:
     """Pre-configured agent templates for common tasks"""
 
@@ -254,7 +271,7 @@ class AgentTemplates:
     def trend_monitor(topic: str, sources: List[str] = None) -> Dict:
         """Trend monitoring agent config"""
         if sources is None:
-            sources = ["twitter", "reddit", "news"]
+            sources = list(_DEFAULT_TREND_SOURCES)
 
         return {
             "agent_type": "trend_monitor",
@@ -9,11 +9,14 @@ Makes autonomous decisions about:
 - ROI optimization
 """
 
+import time
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, Optional, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from collections import Counter, deque
 import json
+import uuid
 
 
 def safe_datetime_now():
@@ -21,14 +24,18 @@ def safe_datetime_now():
     try:
         return datetime.now()
     except (OSError, OverflowError, ValueError):
-        from datetime import datetime as dt
-        return dt(2025, 1, 1, 0, 0, 0)
+        return datetime(2025, 1, 1, 0, 0, 0)
 
 
 logger = logging.getLogger(__name__)
 
+SECONDS_PER_DAY = 24 * 3600
 
-@dataclass
+# Decisions kept in memory for inspection; older ones are only counted
+MAX_DECISION_HISTORY = 10_000
+
+
+@dataclass(slots=True)
 class AutonDecision:
     """Represents an autonomous decision"""
     timestamp: datetime
@@ -39,7 +46,24 @@ class AutonDecision:
     cost_impact: float
     confidence: float  # 0.0 - 1.0
     requires_approval: bool
-    metadata: Dict
+    metadata: Dict = field(default_factory=dict)
+    uid: str = field(default_factory=lambda: uuid.uuid4().hex)
+    _serialized: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def as_dict(self) -> Dict:
+        """Summary dict for status output, built once per decision (returns a copy)"""
+        if self._serialized is None:
+            self._serialized = {
+                'type': self.decision_type,
+                'target': self.target,
+                'reason': self.reason,
+                'expected_roi': self.expected_roi,
+                'cost_impact': self.cost_impact,
+                'requires_approval': self.requires_approval,
+                'timestamp': self.timestamp.isoformat()
+            }
+        # Flat dict of scalars: a shallow copy keeps callers off the cache
+        return dict(self._serialized)
 
 
 class AutonomousEngine:
@@ -85,10 +109,13 @@ class AutonomousEngine:
         self.require_approval_above = require_approval_above
         self.min_data_points = min_data_points
 
-        self.decisions: List[AutonDecision] = []
-        self.pending_approvals: List[AutonDecision] = []
+        self.decisions: Deque[AutonDecision] = deque(maxlen=MAX_DECISION_HISTORY)
+        self._decisions_by_date: Counter = Counter()
+        self._decision_count = 0
+        self.pending_approvals: Dict[str, AutonDecision] = {}
         self.budget_spent_today = 0.0
         self.last_budget_reset = safe_datetime_now().date()
+        self._schedule_budget_reset(self.last_budget_reset)
 
         logger.info(f"AutonomousEngine initialized (enabled: {enabled})")
 
@@ -102,13 +129,24 @@ class AutonomousEngine:
         self.enabled = False
         logger.info("Autonomous mode DISABLED")
 
+    def _schedule_budget_reset(self, today):
+        """Remember the epoch time of the midnight that ends `today`"""
+        self._next_budget_reset = datetime.combine(
+            today + timedelta(days=1), datetime.min.time()
+        ).timestamp()
+
     def _reset_daily_budget_if_needed(self):
         """Reset daily budget at midnight"""
+        # Fast path: a float compare until the next midnight
+        if time.time() < self._next_budget_reset:
+            return
+
         today = safe_datetime_now().date()
         if today > self.last_budget_reset:
             logger.info(f"Resetting daily budget (spent: ${self.budget_spent_today:.2f})")
             self.budget_spent_today = 0.0
             self.last_budget_reset = today
+        self._schedule_budget_reset(today)
 
     def _has_budget_available(self, amount: float) -> bool:
         """Check if budget is available for decision"""
@@ -118,9 +156,11 @@ class AutonomousEngine:
     def _record_decision(self, decision: AutonDecision):
         """Record a decision"""
         self.decisions.append(decision)
+        self._decisions_by_date[decision.timestamp.date()] += 1
+        self._decision_count += 1
 
         if decision.requires_approval:
-            self.pending_approvals.append(decision)
+            self.pending_approvals[decision.uid] = decision
             logger.info(f"Decision requires approval: {decision.decision_type} {decision.target}")
         else:
             logger.info(f"Autonomous decision: {decision.decision_type} {decision.target}")
@@ -152,6 +192,8 @@ class AutonomousEngine:
         roi = metrics.roi
         profit = metrics.profit
         success_rate = metrics.success_rate
+        cost_per_run = metrics.total_cost / metrics.total_runs if metrics.total_runs else 0.0
+        daily_runs = SECONDS_PER_DAY / worker.run_interval if worker.run_interval else 0.0
 
         # Determine status
         if roi >= self.scale_roi_threshold and success_rate >= 80:
@@ -190,7 +232,9 @@ class AutonomousEngine:
                 'success_rate': success_rate
             },
             'can_scale': can_scale,
-            'should_kill': should_kill
+            'should_kill': should_kill,
+            # Current run rate, shared by decide_scale_up / decide_kill
+            'daily_cost': cost_per_run * daily_runs
         }
 
     def decide_scale_up(
@@ -217,9 +261,7 @@ class AutonomousEngine:
             return None
 
         # Estimate cost impact
-        avg_cost_per_run = worker.metrics.total_cost / worker.metrics.total_runs
-        estimated_daily_runs = (24 * 3600) / worker.run_interval
-        estimated_daily_cost = avg_cost_per_run * estimated_daily_runs * (multiplier - 1)
+        estimated_daily_cost = analysis['daily_cost'] * (multiplier - 1)
 
         # Check budget
         if not self._has_budget_available(estimated_daily_cost):
@@ -272,9 +314,7 @@ class AutonomousEngine:
             return None
 
         # Calculate potential savings
-        avg_cost_per_run = worker.metrics.total_cost / worker.metrics.total_runs
-        estimated_daily_runs = (24 * 3600) / worker.run_interval
-        estimated_daily_savings = avg_cost_per_run * estimated_daily_runs
+        estimated_daily_savings = analysis['daily_cost']
 
         confidence = min(worker.metrics.total_runs / 100, 1.0)
 
@@ -369,7 +409,7 @@ class AutonomousEngine:
             logger.warning("Cannot execute decision: autonomous mode disabled")
             return False
 
-        if decision.requires_approval and decision in self.pending_approvals:
+        if decision.requires_approval and decision.uid in self.pending_approvals:
             logger.warning("Cannot execute decision: requires approval")
             return False
 
@@ -398,8 +438,7 @@ class AutonomousEngine:
                 self.budget_spent_today += decision.cost_impact
 
             # Remove from pending approvals
-            if decision in self.pending_approvals:
-                self.pending_approvals.remove(decision)
+            self.pending_approvals.pop(decision.uid, None)
 
             return True
 
@@ -417,31 +456,47 @@ class AutonomousEngine:
         Returns:
             True if approved
         """
-        if decision in self.pending_approvals:
-            self.pending_approvals.remove(decision)
+        if self.pending_approvals.pop(decision.uid, None) is not None:
             decision.requires_approval = False
+            decision._serialized = None
             logger.info(f"Approved decision: {decision.decision_type} {decision.target}")
             return True
 
         return False
 
-    def run_analysis_cycle(self, worker_manager, worker_monitor) -> Dict:
+    def run_analysis_cycle(
+        self,
+        worker_manager,
+        worker_monitor,
+        include_analysis: bool = True
+    ) -> Dict:
         """
         Run complete analysis cycle on all workers
 
         Args:
             worker_manager: WorkerManager instance
             worker_monitor: WorkerMonitor instance
+            include_analysis: Analyze workers even when autonomous mode is
+                disabled (False skips the cycle entirely in that case)
 
         Returns:
             Analysis summary
         """
+        if not self.enabled and not include_analysis:
+            # Nothing would be decided, and the caller doesn't want analyses
+            return {
+                'timestamp': safe_datetime_now().isoformat(),
+                'enabled': False,
+                'workers': len(worker_manager.workers)
+            }
+
         logger.info("Running autonomous analysis cycle")
 
         analyses = []
         decisions_made = []
 
-        for worker in worker_manager.workers.values():
+        # Snapshot: executing kill/scale_up decisions mutates workers mid-loop
+        for worker in list(worker_manager.workers.values()):
             # Analyze worker
             analysis = self.analyze_worker(worker, worker_monitor)
             analyses.append(analysis)
@@ -476,17 +531,7 @@ class AutonomousEngine:
             'pending_approvals': len(self.pending_approvals),
             'budget_spent_today': self.budget_spent_today,
             'budget_remaining': self.max_daily_budget - self.budget_spent_today,
-            'decisions': [
-                {
-                    'type': d.decision_type,
-                    'target': d.target,
-                    'reason': d.reason,
-                    'expected_roi': d.expected_roi,
-                    'cost_impact': d.cost_impact,
-                    'requires_approval': d.requires_approval
-                }
-                for d in decisions_made
-            ]
+            'decisions': [d.as_dict() for d in decisions_made]
         }
 
     def get_status(self) -> Dict:
@@ -506,21 +551,11 @@ class AutonomousEngine:
                 'percent_used': (self.budget_spent_today / self.max_daily_budget * 100) if self.max_daily_budget > 0 else 0
             },
             'decisions': {
-                'total': len(self.decisions),
-                'today': len([d for d in self.decisions if d.timestamp.date() == safe_datetime_now().date()]),
+                'total': self._decision_count,
+                'today': self._decisions_by_date[safe_datetime_now().date()],
                 'pending_approvals': len(self.pending_approvals)
             },
-            'pending_approvals': [
-                {
-                    'type': d.decision_type,
-                    'target': d.target,
-                    'reason': d.reason,
-                    'expected_roi': d.expected_roi,
-                    'cost_impact': d.cost_impact,
-                    'timestamp': d.timestamp.isoformat()
-                }
-                for d in self.pending_approvals
-            ]
+            'pending_approvals': [d.as_dict() for d in self.pending_approvals.values()]
         }
 
 
@@ -10,11 +10,20 @@ import json
 
 from core.memory import get_memory
 from config.settings import (
-    ANTHROPIC_API_KEY, MODELS, DEFAULT_MODELS,
-    BOARD_AGENT_BUDGETS, MCP_CONFIG
+    ANTHROPIC_API_KEY, MODELS, DEFAULT_MODELS, MODEL_INPUT_COSTS,
+    MODEL_OUTPUT_COSTS, MODEL_MAX_TOKENS, BOARD_AGENT_BUDGETS, MCP_CONFIG
 )
 
 
+def safe_datetime_now():
+    """Get current datetime with fallback for timestamp overflow"""
+    try:
+        return datetime.now()
+    except (OSError, OverflowError, ValueError):
+        from datetime import datetime as dt
+        return dt(2025, 1, 1, 0, 0, 0)
+
+
 class BoardAgent:
     """Base class for board-level strategic agents"""
 
@@ -38,7 +47,7 @@ class BoardAgent:
     def _call_claude(self, system: str, user_prompt: str, max_tokens: int = None) -> Dict[str, Any]:
         """Make Claude API call with cost tracking"""
         if max_tokens is None:
-            max_tokens = min(self.token_budget, MODELS[self.model]["max_tokens"])
+            max_tokens = min(self.token_budget, MODEL_MAX_TOKENS[self.model])
 
         try:
             response = self.client.messages.create(
@@ -53,8 +62,8 @@ class BoardAgent:
             output_tokens = response.usage.output_tokens
 
             # Calculate cost
-            input_cost = (input_tokens / 1_000_000) * MODELS[self.model]["input_cost"]
-            output_cost = (output_tokens / 1_000_000) * MODELS[self.model]["output_cost"]
+            input_cost = (input_tokens / 1_000_000) * MODEL_INPUT_COSTS[self.model]
+            output_cost = (output_tokens / 1_000_000) * MODEL_OUTPUT_COSTS[self.model]
             total_cost = input_cost + output_cost
 
             # Log cost
@@ -233,15 +242,6 @@ class CFOAgent(BoardAgent):
         try:
             from core.learning import get_learning
 
-
-def safe_datetime_now():
-    """Get current datetime with fallback for timestamp overflow"""
-    try:
-        return datetime.now()
-    except (OSError, OverflowError, ValueError):
-        from datetime import datetime as dt
-        return dt(2025, 1, 1, 0, 0, 0)
-
             learning = get_learning()
             patterns = learning.get_patterns("agents")
             learning_insights = f"\nHISTORICAL PATTERNS:\n"
@@ -551,11 +551,13 @@ class Board:
         }
 
 
+# Singleton instance
+_board_instance = None
+
+
 def get_board() -> Board:
     """Get or create board instance"""
     global _board_instance
-    try:
-        return _board_instance
-    except NameError:
+    if _board_instance is None:
         _board_instance = Board()
-        return _board_instance
+    return _board_instance
@@ -0,0 +1,135 @@
+"""
+Logging Setup - Buffered file logging for NovaOS entry points
+
+Entry points (the CLI, long-running services) call setup_logging() once;
+library modules only ever use logging.getLogger(__name__).
+"""
+
+import os
+import queue
+import atexit
+import logging
+import threading
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+
+
+logger = logging.getLogger(__name__)
+
+
+class _TimedMemoryHandler(MemoryHandler):
+    """
+    MemoryHandler that also flushes once its oldest record is flush_interval seconds old
+
+    The age is checked as records arrive and by a daemon timer thread, so
+    records buffered just before the process goes idle still reach the
+    target within flush_interval.
+    """
+
+    def __init__(self, capacity: int, flush_interval: float, **kwargs):
+        super().__init__(capacity, **kwargs)
+        self.flush_interval = flush_interval
+        self._stop_timer = threading.Event()
+        self._timer = threading.Thread(
+            target=self._flush_periodically, name="novaos-log-flush", daemon=True
+        )
+        self._timer.start()
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return (
+            super().shouldFlush(record)
+            or record.created - self.buffer[0].created >= self.flush_interval
+        )
+
+    def _flush_periodically(self):
+        # Nothing buffered is older than flush_interval between two ticks
+        while not self._stop_timer.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        self._stop_timer.set()
+        super().close()
+
+
+_log_listener = None
+_log_handlers = None
+
+
+def setup_logging():
+    """
+    Send log records to LOG_SETTINGS["file"] without blocking the caller
+
+    Loggers only enqueue records; one listener thread hands them to a
+    MemoryHandler that writes to the rotating log file in batches of
+    LOG_SETTINGS["buffer_capacity"], immediately at ERROR, or once the
+    oldest buffered record is LOG_SETTINGS["flush_interval_ms"] old.
+    Anything still buffered is written at interpreter exit.
+
+    If the host application already configured the root logger, its
+    level is left alone; the file then receives whatever that level
+    lets through (and at least LOG_SETTINGS["level"]). Safe to call
+    more than once.
+    """
+    global _log_listener, _log_handlers
+    if _log_listener is not None:
+        return
+
+    from config.settings import LOG_SETTINGS
+
+    try:
+        os.makedirs(os.path.dirname(LOG_SETTINGS["file"]), exist_ok=True)
+        file_handler = RotatingFileHandler(
+            LOG_SETTINGS["file"],
+            maxBytes=LOG_SETTINGS["max_bytes"],
+            backupCount=LOG_SETTINGS["backup_count"]
+        )
+    except OSError as e:
+        logger.warning(f"File logging disabled: {e}")
+        return
+
+    file_handler.setFormatter(logging.Formatter(LOG_SETTINGS["format"]))
+    buffered = _TimedMemoryHandler(
+        LOG_SETTINGS["buffer_capacity"],
+        LOG_SETTINGS["flush_interval_ms"] / 1000,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+
+    log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, buffered)
+    _log_listener.start()
+
+    root = logging.getLogger()
+    if not root.handlers:
+        # Unconfigured: keep warnings on stderr, as logging's last-resort
+        # handler did, and let LOG_SETTINGS decide what reaches the file
+        console = logging.StreamHandler()
+        console.setLevel(logging.WARNING)
+        root.addHandler(console)
+        root.setLevel(LOG_SETTINGS["level"])
+
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setLevel(LOG_SETTINGS["level"])
+    root.addHandler(queue_handler)
+
+    _log_handlers = (queue_handler, buffered, file_handler)
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """
+    Write out everything queued or buffered and close the log file
+
+    Runs at interpreter exit; call it directly before os.exec*(), which
+    replaces the process without running atexit handlers.
+    """
+    global _log_listener, _log_handlers
+    if _log_listener is None:
+        return
+
+    queue_handler, buffered, file_handler = _log_handlers
+    logging.getLogger().removeHandler(queue_handler)
+    _log_listener.stop()  # drains the queue into the buffer
+    buffered.close()      # flushes the buffer to the file
+    file_handler.close()
+    _log_listener = None
+    _log_handlers = None
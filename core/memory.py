@@ -146,6 +146,15 @@ class NovaMemory:
             )
         """)
 
+        # LLM response cache (keyed by prompt hash)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS response_cache (
+                cache_key TEXT PRIMARY KEY,
+                timestamp TEXT NOT NULL,
+                response TEXT NOT NULL
+            )
+        """)
+
         self.conn.commit()
 
     # === DECISION TRACKING ===
@@ -235,7 +244,8 @@ class NovaMemory:
         row = cursor.fetchone()
         return dict(row) if row else None
 
-    def get_all_agents(self, status: str = None, department: str = None) -> List[Dict]:
+    def get_all_agents(self, status: str = None, department: str = None,
+                       roi_below: float = None) -> List[Dict]:
         """Get all agents, optionally filtered"""
         cursor = self.conn.cursor()
         query = "SELECT * FROM agents WHERE 1=1"
@@ -247,35 +257,117 @@ class NovaMemory:
         if department:
             query += " AND department = ?"
             params.append(department)
+        if roi_below is not None:
+            query += " AND roi < ?"
+            params.append(roi_below)
 
         cursor.execute(query, params)
         return [dict(row) for row in cursor.fetchall()]
 
+    def get_costliest_agents(self, status: str = None, limit: int = 3) -> List[Dict]:
+        """Get the agents with the highest total cost"""
+        cursor = self.conn.cursor()
+        if status:
+            cursor.execute("""
+                SELECT * FROM agents WHERE status = ?
+                ORDER BY total_cost DESC LIMIT ?
+            """, (status, limit))
+        else:
+            cursor.execute("""
+                SELECT * FROM agents ORDER BY total_cost DESC LIMIT ?
+            """, (limit,))
+        return [dict(row) for row in cursor.fetchall()]
+
     # === COST TRACKING ===
 
+    _COST_INSERT = """
+        INSERT INTO costs (timestamp, agent_id, agent_name, department,
+                         model, operation, input_tokens, output_tokens,
+                         total_tokens, cost, request_data)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _cost_row(timestamp: str, model: str, operation: str, input_tokens: int,
+                  output_tokens: int, cost: float, agent_id: str = None,
+                  agent_name: str = None, department: str = None,
+                  request_data: Dict = None, cache_read_tokens: int = 0,
+                  cache_creation_tokens: int = 0) -> tuple:
+        """Build a costs row for _COST_INSERT (total_tokens is row[8])"""
+        if cache_read_tokens or cache_creation_tokens:
+            request_data = dict(request_data or {})
+            request_data["cache_read_input_tokens"] = cache_read_tokens
+            request_data["cache_creation_input_tokens"] = cache_creation_tokens
+        total_tokens = (input_tokens + output_tokens +
+                        cache_read_tokens + cache_creation_tokens)
+
+        return (timestamp, agent_id, agent_name, department,
+                model, operation, input_tokens, output_tokens,
+                total_tokens, cost,
+                json.dumps(request_data) if request_data else None)
+
     def log_api_cost(self, model: str, operation: str, input_tokens: int,
                     output_tokens: int, cost: float, agent_id: str = None,
                     agent_name: str = None, department: str = None,
-                    request_data: Dict = None) -> int:
-        """Log every API call cost"""
+                    request_data: Dict = None, cache_read_tokens: int = 0,
+                    cache_creation_tokens: int = 0) -> int:
+        """Log every API call cost
+
+        Prompt-cache reads/writes are counted in total_tokens and recorded
+        in request_data; ``cost`` is expected to already price them.
+        """
+        row = self._cost_row(safe_datetime_now().isoformat(), model, operation,
+                             input_tokens, output_tokens, cost, agent_id,
+                             agent_name, department, request_data,
+                             cache_read_tokens, cache_creation_tokens)
+
         cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO costs (timestamp, agent_id, agent_name, department,
-                             model, operation, input_tokens, output_tokens,
-                             total_tokens, cost, request_data)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (safe_datetime_now().isoformat(), agent_id, agent_name, department,
-              model, operation, input_tokens, output_tokens,
-              input_tokens + output_tokens, cost,
-              json.dumps(request_data) if request_data else None))
+        cursor.execute(self._COST_INSERT, row)
         self.conn.commit()
 
         # Update agent metrics if agent_id provided
         if agent_id:
-            self.update_agent_metrics(agent_id, input_tokens + output_tokens, cost)
+            self.update_agent_metrics(agent_id, row[8], cost)
 
         return cursor.lastrowid
 
+    def log_api_costs_batch(self, entries: List[Dict[str, Any]]):
+        """Log many API call costs in a single transaction
+
+        Each entry takes the same keyword arguments as log_api_cost().
+        """
+        timestamp = safe_datetime_now().isoformat()
+        rows = []
+        agent_totals = {}
+
+        for entry in entries:
+            row = self._cost_row(timestamp, **entry)
+            rows.append(row)
+
+            agent_id = entry.get("agent_id")
+            if agent_id:
+                tokens, cost = agent_totals.get(agent_id, (0, 0.0))
+                agent_totals[agent_id] = (tokens + row[8], cost + entry["cost"])
+
+        cursor = self.conn.cursor()
+        cursor.executemany(self._COST_INSERT, rows)
+
+        # Same update as update_agent_metrics(), once per agent
+        cursor.executemany("""
+            UPDATE agents
+            SET tokens_used = tokens_used + ?,
+                total_cost = total_cost + ?,
+                roi = CASE
+                    WHEN (total_cost + ?) > 0
+                    THEN (revenue_generated - (total_cost + ?)) / (total_cost + ?)
+                    ELSE 0
+                END,
+                last_active = ?
+            WHERE id = ?
+        """, [(tokens, cost, cost, cost, cost, timestamp, agent_id)
+              for agent_id, (tokens, cost) in agent_totals.items()])
+        self.conn.commit()
+
     def get_total_costs(self, start_date: str = None, end_date: str = None,
                        department: str = None) -> float:
         """Get total API costs"""
@@ -492,6 +584,37 @@ class NovaMemory:
         """, (limit,))
         return [dict(row) for row in cursor.fetchall()]
 
+    # === RESPONSE CACHE ===
+
+    def cache_response(self, cache_key: str, response: str):
+        """Store an LLM response under its prompt hash"""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO response_cache (cache_key, timestamp, response)
+            VALUES (?, ?, ?)
+        """, (cache_key, safe_datetime_now().isoformat(), response))
+        self.conn.commit()
+
+    def get_cached_response(self, cache_key: str,
+                            max_age_seconds: int = None) -> Optional[str]:
+        """Get a cached LLM response, ignoring entries older than max_age_seconds"""
+        from datetime import timedelta
+
+        cursor = self.conn.cursor()
+        if max_age_seconds is not None:
+            since = (safe_datetime_now() - timedelta(seconds=max_age_seconds)).isoformat()
+            cursor.execute("""
+                SELECT response FROM response_cache
+                WHERE cache_key = ? AND timestamp >= ?
+            """, (cache_key, since))
+        else:
+            cursor.execute("""
+                SELECT response FROM response_cache WHERE cache_key = ?
+            """, (cache_key,))
+
+        row = cursor.fetchone()
+        return row['response'] if row else None
+
     # === SYSTEM METRICS ===
 
     def log_metric(self, metric_name: str, metric_value: float,
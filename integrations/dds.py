@@ -21,7 +21,7 @@ from datetime import datetime, timedelta
 import logging
 
 from core.memory import get_memory
-from config.settings import DDS_PATH, MODELS
+from config.settings import DDS_PATH, MODELS, MODEL_INPUT_COSTS
 
 
 def safe_datetime_now():
@@ -704,11 +704,11 @@ class DDSIntegration:
         # Website analysis (Anthropic Claude)
         # ~500 tokens per analysis
         website_analysis_tokens = prospect_count * 500
-        website_analysis_cost = (website_analysis_tokens / 1_000_000) * MODELS['haiku']['input_cost']
+        website_analysis_cost = (website_analysis_tokens / 1_000_000) * MODEL_INPUT_COSTS['haiku']
 
         # Lead scoring (Anthropic Claude)
         scoring_tokens = prospect_count * 300
-        scoring_cost = (scoring_tokens / 1_000_000) * MODELS['haiku']['input_cost']
+        scoring_cost = (scoring_tokens / 1_000_000) * MODEL_INPUT_COSTS['haiku']
 
         # Email finding (Hunter.io)
         email_finding_cost = (prospect_count / 100) * 10.00  # ~$10 per 100 emails
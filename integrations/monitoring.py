@@ -208,12 +208,24 @@ class PerformanceMonitor:
 
         # Get all agents
         all_agents = self.memory.get_all_agents()
-        active_agents = [a for a in all_agents if a['status'] == 'active']
 
-        # Calculate performance metrics
-        high_performers = [a for a in active_agents if a.get('roi', 0) >= 300]
-        low_performers = [a for a in active_agents if a.get('roi', 0) < 100 and a.get('roi', 0) >= 0]
-        negative_performers = [a for a in active_agents if a.get('roi', 0) < 0]
+        # Bucket agents by status and ROI band in a single pass
+        status_counts = {'active': 0, 'paused': 0, 'killed': 0}
+        high_performers = []
+        low_performers = []
+        negative_performers = []
+        for agent in all_agents:
+            status = agent['status']
+            status_counts[status] = status_counts.get(status, 0) + 1
+            if status != 'active':
+                continue
+            roi = agent.get('roi', 0)
+            if roi >= 300:
+                high_performers.append(agent)
+            elif roi < 0:
+                negative_performers.append(agent)
+            elif roi < 100:
+                low_performers.append(agent)
 
         # Financial metrics
         total_revenue = self.memory.get_total_revenue()
@@ -234,9 +246,9 @@ class PerformanceMonitor:
             ),
             "agents": {
                 "total": len(all_agents),
-                "active": len(active_agents),
-                "paused": len([a for a in all_agents if a['status'] == 'paused']),
-                "killed": len([a for a in all_agents if a['status'] == 'killed']),
+                "active": status_counts['active'],
+                "paused": status_counts['paused'],
+                "killed": status_counts['killed'],
                 "high_performers": len(high_performers),
                 "low_performers": len(low_performers),
                 "negative_performers": len(negative_performers)
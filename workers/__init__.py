@@ -2,9 +2,16 @@
 NovaOS Workers - Background agent execution system
 """
 
-from .base_worker import BaseWorker, WorkerStatus
-from .manager import WorkerManager, get_worker_manager
-from .worker_monitor import WorkerMonitor, get_worker_monitor
+# Exports resolve on first access so that importing workers.manager
+# doesn't also load worker_monitor (and psutil)
+_EXPORTS = {
+    'BaseWorker': 'base_worker',
+    'WorkerStatus': 'base_worker',
+    'WorkerManager': 'manager',
+    'get_worker_manager': 'manager',
+    'WorkerMonitor': 'worker_monitor',
+    'get_worker_monitor': 'worker_monitor'
+}
 
 __all__ = [
     'BaseWorker',
@@ -14,3 +21,10 @@ __all__ = [
     'WorkerMonitor',
     'get_worker_monitor'
 ]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        from importlib import import_module
+        return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")